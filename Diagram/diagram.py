@@ -1,16 +1,26 @@
+import io
 import os
 import shutil
+import sys
 import textwrap
+import time
+from functools import partial
+from itertools import groupby
+from xml.sax.saxutils import escape
 import matplotlib.pyplot as plt
 from matplotlib.patches import Circle, Arrow, FancyArrowPatch
 # Requires: pip install matplotlib-venn
 from matplotlib_venn import venn2, venn2_circles
 # Requires: pip install reportlab
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import SimpleDocTemplate, Spacer, PageBreak, KeepTogether, Table
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import inch
-from reportlab.lib import colors
+
+# Shared helpers live in report_common/ at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from report_common import (PROFILE, RenderCache, add_profile_arguments, build_doc, build_sections, cached_paragraph,
+                           diagram_styles, embedded_image, finish_profile, image_settings, map_in_workers,
+                           render_section_pdf, start_profile, stitch_pdfs, svg_flowable, theme_key)
 
 # --- SCRIPT CONFIGURATION ---
 
@@ -22,121 +32,321 @@ OUTPUT_DIR = '/storage/emulated/0/Download/'
 
 PDF_FILENAME = 'MMPH-009_Diagram_Solutions_Complete.pdf'
 IMG_DIR = 'temp_diagram_images'
+# Set to True to render diagrams into in-memory buffers instead of IMG_DIR.
+# The draw_* functions accept either a file path or a binary file-like object.
+IN_MEMORY_IMAGES = False
+# 'png' embeds 150-dpi raster images; 'svg' embeds the diagrams as native vector
+# drawings (requires svglib), which gives smaller, sharper PDFs.
+IMAGE_FORMAT = 'png'
+DIAGRAM_DPI = 150 # Resolution of the raster diagrams
+# Raster diagrams are resampled to this effective resolution at their size on
+# the page before embedding (0 = embed them as drawn), see report_common/images.py
+EMBED_DPI = 200
+# True lays out 'table' diagrams as native reportlab Tables (selectable text,
+# no raster image); False draws them as images with create_table_image.
+# A native table that cannot be built falls back to the image.
+NATIVE_TABLES = True
+# Persistent diagram cache: unchanged diagrams are not redrawn on rebuilds.
+# Unlike IMG_DIR it is kept between runs; --purge-cache empties it.
+USE_DIAGRAM_CACHE = True
+DIAGRAM_CACHE_DIR = 'diagram_cache' # Inside the PDF's directory
+DIAGRAM_CACHE_MAX_BYTES = 100 * 1024 * 1024 # Least recently used diagrams are evicted beyond this
+# Set to True to cache every question's laid-out page (keyed by its EXAM_DATA
+# entry) and only redraw the questions that changed (requires pypdf).
+INCREMENTAL_BUILD = False
+PAGE_CACHE_DIR = 'diagram_page_cache' # Inside the PDF's directory
+DIAGRAM_RENDERER_VERSION = 4 # Bump whenever the drawing functions change
+# Processes used to lay out the exam years side by side; their PDFs are merged
+# in order (requires pypdf). 1 = lay out the whole document in one doc.build.
+SECTION_WORKERS = 1
+PAGE_NUMBERS = False # Stamp "Page X of N" on every page after the build
+# Processes used to draw the diagrams before the story is assembled
+# (1 = draw each one in turn while laying out its page).
+DIAGRAM_WORKERS = os.cpu_count() or 1
 
 # --- DATA STRUCTURE: EXAM QUESTIONS AND SOLUTIONS ---
 
 # Data from all 3 PDFs is included here.
+# Each entry's 'diagram' spec names a type from DIAGRAM_RENDERERS and its
+# 'name' (appended to the diagram title); the other keys are passed to that
+# type's draw_* function as keyword arguments.
 EXAM_DATA = [
     # ==================== JUNE 2023 ====================
     {
         'year': 'June 2023',
         'question_number': 1,
         'question_text': "1. Briefly differentiate between Domestic vs. International Human Resource Management (IHRM). Discuss and describe various approaches to International Human Resource Management and their advantages and disadvantages.",
-        'diagram_suggestion': "Diagram Suggestion: A table clearly differentiating DHRM and IHRM across key parameters (scope, risk, activities, etc.). For EPRG, a 2x2 matrix or a series of diagrams showing HQ-subsidiary staffing patterns for each approach."
+        'diagram_suggestion': "Diagram Suggestion: A table clearly differentiating DHRM and IHRM across key parameters (scope, risk, activities, etc.). For EPRG, a 2x2 matrix or a series of diagrams showing HQ-subsidiary staffing patterns for each approach.",
+        'diagram': {
+            'type': 'table', 'name': "DHRM vs IHRM & EPRG Framework",
+            'data': [
+                ['Parameter', 'Domestic HRM (DHRM)', 'International HRM (IHRM)'],
+                ['Scope', 'National', 'Global (Multiple Countries)'],
+                ['Activities', 'Standard HR Functions', 'Adds intl. tax, relocation, family support'],
+                ['Risk', 'Lower (e.g., legal compliance)', 'Higher (e.g., expat failure, political)'],
+            ],
+            'col_widths': [0.2, 0.4, 0.4],
+        },
     },
     {
         'year': 'June 2023',
         'question_number': 2,
         'question_text': "2. What do you understand by Strategic International Human Resource Management? What kinds of strategies are used by MNCs to compete in global markets? Discuss with relevant examples.",
-        'diagram_suggestion': "Diagram Suggestion: A 2x2 matrix with 'Pressure for Global Integration' on one axis and 'Pressure for Local Responsiveness' on the other. The four quadrants would represent Global, Multidomestic, Transnational, and (perhaps) International (low on both, though less common as a distinct competitive strategy, often an early phase) strategies. Regional could be shown as a mid-point adaptation."
+        'diagram_suggestion': "Diagram Suggestion: A 2x2 matrix with 'Pressure for Global Integration' on one axis and 'Pressure for Local Responsiveness' on the other. The four quadrants would represent Global, Multidomestic, Transnational, and (perhaps) International (low on both, though less common as a distinct competitive strategy, often an early phase) strategies. Regional could be shown as a mid-point adaptation.",
+        'diagram': {
+            'type': 'matrix', 'name': "MNC Competitive Strategies",
+            'xlabel': "Pressure for Local Responsiveness", 'ylabel': "Pressure for Global Integration",
+            'q1': "Global Strategy\n(High Integration,\nLow Responsiveness)",
+            'q2': "Transnational Strategy\n(High Integration,\nHigh Responsiveness)",
+            'q3': "International Strategy\n(Low Integration,\nLow Responsiveness)",
+            'q4': "Multidomestic Strategy\n(Low Integration,\nHigh Responsiveness)",
+            'midpoint': "Regional\n(Mid-point)",
+        },
     },
     {
         'year': 'June 2023',
         'question_number': 3,
         'question_text': "3. “Training in preparing and supporting personnel on international assignments is an important process.” Describe and discuss.",
-        'diagram_suggestion': "Diagram Suggestion: A timeline or flowchart showing the stages of an international assignment (Pre-Departure, In-Country, Pre-Repatriation) with the types of training and support relevant to each stage listed below."
+        'diagram_suggestion': "Diagram Suggestion: A timeline or flowchart showing the stages of an international assignment (Pre-Departure, In-Country, Pre-Repatriation) with the types of training and support relevant to each stage listed below.",
+        'diagram': {
+            'type': 'flowchart', 'name': "International Assignment Training Timeline",
+            'steps': ['Pre-Departure\n(Cultural, Language,\nPractical Training)',
+                      'In-Country\n(Mentorship, Ongoing\nSupport, Coaching)',
+                      'Pre-Repatriation\n(Career Planning,\nReverse Culture Shock)'],
+        },
     },
     {
         'year': 'June 2023',
         'question_number': 4,
         'question_text': "4. Briefly describe and discuss total reward system from the perspective of International Human Resource Management. What kinds of challenges are encountered by an expatriate in relation to taxation?",
-        'diagram_suggestion': "Diagram Suggestion: A circular diagram of 'Total Rewards' with segments for Financial (Base Salary, Incentives, Allowances) and Non-Financial (Career Dev, Recognition, Work-Life Balance). For Taxation Challenges, a world map with arrows between two countries highlighting 'Double Tax Liability' and complex 'Tax Treaties'."
+        'diagram_suggestion': "Diagram Suggestion: A circular diagram of 'Total Rewards' with segments for Financial (Base Salary, Incentives, Allowances) and Non-Financial (Career Dev, Recognition, Work-Life Balance). For Taxation Challenges, a world map with arrows between two countries highlighting 'Double Tax Liability' and complex 'Tax Treaties'.",
+        'diagram': {
+            'type': 'donut', 'name': "Total Rewards & Taxation Challenges",
+            'donut_title': "Total Rewards System", 'labels': ['Financial', 'Non-Financial'], 'colors': ['#ff9999', '#66b3ff'],
+            'panel_title': "Intl. Taxation Challenges", 'left_label': 'Home Country', 'right_label': 'Host Country',
+            'link_label': 'Double Tax Liability',
+        },
     },
     {
         'year': 'June 2023',
         'question_number': 5,
         'question_text': "5. Discuss and describe the theories of motivation and their perspective from international context.",
-        'diagram_suggestion': "Diagram Suggestion: A table comparing the key tenets of each motivation theory and then a column discussing its 'Cross-Cultural Applicability/Considerations.' Highlight how cultural dimensions (e.g., individualism, power distance) might moderate the effects of each theory."
+        'diagram_suggestion': "Diagram Suggestion: A table comparing the key tenets of each motivation theory and then a column discussing its 'Cross-Cultural Applicability/Considerations.' Highlight how cultural dimensions (e.g., individualism, power distance) might moderate the effects of each theory.",
+        'diagram': {
+            'type': 'table', 'name': "Motivation Theories in an International Context",
+            'data': [
+                ['Theory', 'Key Tenets', 'Cross-Cultural Considerations'],
+                ['Maslow\'s Hierarchy', 'Needs are hierarchical', 'Hierarchy & salience of needs can vary culturally.'],
+                ['Herzberg\'s Two-Factor', 'Hygiene vs. Motivator factors', 'What constitutes a motivator is culturally dependent.'],
+                ['Expectancy Theory', 'Effort -> Performance -> Reward', 'Valence of rewards is culturally influenced.'],
+                ['Equity Theory', 'Fair input/output ratio vs. others', 'Concept of fairness and comparison group varies.']
+            ],
+            'col_widths': [0.15, 0.35, 0.5],
+        },
     },
     {
         'year': 'June 2023',
         'question_number': 6,
         'question_text': "6. Describe the principles and characteristics of high performance work systems and discuss how high performance organization is related to high performance work system.",
-        'diagram_suggestion': "Diagram Suggestion: A diagram showing 'HPWS' (listing its characteristics/principles as inputs/components) leading to an arrow pointing to 'High Performance Organization' (listing its outcomes like superior results, adaptability, innovation)."
+        'diagram_suggestion': "Diagram Suggestion: A diagram showing 'HPWS' (listing its characteristics/principles as inputs/components) leading to an arrow pointing to 'High Performance Organization' (listing its outcomes like superior results, adaptability, innovation).",
+        'diagram': {
+            'type': 'input_output', 'name': "Relationship between HPWS and HPO",
+            'inputs': "Inputs (HPWS):\n• Selective Hiring\n• Empowerment\n• Info Sharing",
+            'outputs': "Outcomes (HPO):\n• Superior Results\n• Adaptability\n• Innovation",
+        },
     },
     {
         'year': 'June 2023',
         'question_number': 7,
         'question_text': "7. Describe and discuss the role of employer's associations from international context.",
-        'diagram_suggestion': "Diagram Suggestion: A diagram showing a central 'MNC' interacting with its 'Host Country Environment.' An 'Employer Association' (national level) influences the host country IR. Above this, an 'International Employer Association' (e.g., IOE, BusinessEurope) is shown influencing 'Supranational Bodies' (e.g., EU, ILO, OECD) which in turn influence the MNC's operating environment."
+        'diagram_suggestion': "Diagram Suggestion: A diagram showing a central 'MNC' interacting with its 'Host Country Environment.' An 'Employer Association' (national level) influences the host country IR. Above this, an 'International Employer Association' (e.g., IOE, BusinessEurope) is shown influencing 'Supranational Bodies' (e.g., EU, ILO, OECD) which in turn influence the MNC's operating environment.",
+        'diagram': {
+            'type': 'boxes', 'name': "Role of Employer's Associations", 'figsize': [10, 7],
+            'boxes': [
+                {'x': 0.5, 'y': 0.1, 'text': 'MNC', 'fc': 'gold', 'pad': 5},
+                {'x': 0.2, 'y': 0.4, 'text': "Host Country Environment", 'fc': 'lightgrey'},
+                {'x': 0.8, 'y': 0.4, 'text': "National Employer\nAssociation", 'fc': 'lightgrey'},
+                {'x': 0.5, 'y': 0.7, 'text': "International Employer Association", 'fc': 'lightblue'},
+                {'x': 0.5, 'y': 0.9, 'text': "Supranational Bodies\n(EU, ILO, OECD)", 'fc': 'lightgreen'},
+            ],
+        },
     },
     {
         'year': 'June 2023',
         'question_number': 8,
         'question_text': "8. Identify the trends and challenges faced by International Human Resource Managers. How can they be managed?",
-        'diagram_suggestion': "Diagram Suggestion: A mind map with 'IHRM' at the center. One set of branches for 'Key Trends' (Globalization, Technology, Diversity, etc.) and another set for 'Key Challenges' (Talent, Culture, Compliance, etc.). Arrows could show how trends lead to challenges. A third set of branches could show 'Management Strategies'."
+        'diagram_suggestion': "Diagram Suggestion: A mind map with 'IHRM' at the center. One set of branches for 'Key Trends' (Globalization, Technology, Diversity, etc.) and another set for 'Key Challenges' (Talent, Culture, Compliance, etc.). Arrows could show how trends lead to challenges. A third set of branches could show 'Management Strategies'.",
+        'diagram': {
+            'type': 'boxes', 'name': "IHRM Trends, Challenges, and Strategies", 'figsize': [10, 8],
+            'boxes': [
+                {'x': 0.5, 'y': 0.5, 'text': "IHRM", 'va': 'center', 'boxstyle': 'circle', 'fc': 'gold', 'pad': 10},
+                {'x': 0.1, 'y': 0.8, 'text': "Trends:\n- Globalization\n- Tech", 'fc': 'lightblue'},
+                {'x': 0.9, 'y': 0.8, 'text': "Challenges:\n- Culture\n- Talent Mgt.", 'fc': 'lightcoral'},
+                {'x': 0.5, 'y': 0.1, 'text': "Strategies:\n- Global Mindset\n- Leverage Tech", 'fc': 'lightgreen'},
+            ],
+        },
     },
     # ==================== JUNE 2024 ====================
     {
         'year': 'June 2024',
         'question_number': 1,
         'question_text': "1. Define and discuss the characteristics of International Human Resource Management. What are the similarities and differences between domestic and international human resource management?",
-        'diagram_suggestion': "Diagram Suggestion: A Venn diagram showing DHRM as one circle and IHRM as a larger, encompassing circle. The overlapping section represents 'Core HR Functions.' The unique part of the IHRM circle lists 'Additional IHRM Activities & Complexities' (e.g., Expatriate Management, Cross-Cultural Issues, International Taxation)."
+        'diagram_suggestion': "Diagram Suggestion: A Venn diagram showing DHRM as one circle and IHRM as a larger, encompassing circle. The overlapping section represents 'Core HR Functions.' The unique part of the IHRM circle lists 'Additional IHRM Activities & Complexities' (e.g., Expatriate Management, Cross-Cultural Issues, International Taxation).",
+        'diagram': {
+            'type': 'venn2', 'name': "DHRM vs. IHRM",
+            'label1': "DHRM", 'label2': "IHRM",
+            'overlap_text': "Core HR Functions\n(Recruit, Train, etc.)",
+            'unique1_text': "• Single National Context\n• Lower Risk & Complexity",
+            'unique2_text': "• Multiple Countries\n• Additional Activities (Tax)\n• Higher Risk & Complexity",
+        },
     },
     {
         'year': 'June 2024',
         'question_number': 2,
         'question_text': "2. What are the significant culture differences between individualistic society and collectivist society? Discuss the significant cultural difference between India and Turkey.",
-        'diagram_suggestion': "Diagram Suggestion: A two-column table contrasting 'Individualistic Society' and 'Collectivist Society' across key aspects (Self-Concept, Goals, Relationships, etc.). For India vs. Turkey, another two-column table highlighting similarities (e.g., Collectivism, High Power Distance) and then specific distinguishing features for each."
+        'diagram_suggestion': "Diagram Suggestion: A two-column table contrasting 'Individualistic Society' and 'Collectivist Society' across key aspects (Self-Concept, Goals, Relationships, etc.). For India vs. Turkey, another two-column table highlighting similarities (e.g., Collectivism, High Power Distance) and then specific distinguishing features for each.",
+        'diagram': {
+            'type': 'table', 'name': "Cultural Differences",
+            'data': [
+                ['Aspect', 'Individualistic Society', 'Collectivist Society'],
+                ['Self-Concept', "'I' identity, personal uniqueness", "'We' identity, group membership"],
+                ['Goals', 'Personal achievement, self-interest', 'Group goals, harmony, loyalty'],
+                ['Relationships', 'Loose ties, nuclear family focus', 'Strong, cohesive in-groups'],
+            ],
+            'col_widths': [0.2, 0.4, 0.4],
+        },
     },
     {
         'year': 'June 2024',
         'question_number': 3,
         'question_text': "3. Who is an expatriate? What are the qualities required to become a successful expatriate? What are the main reasons for expatriate failure?",
-        'diagram_suggestion': "Diagram Suggestion: A profile of a 'Successful Expatriate' highlighting key qualities in a star or circular diagram. For 'Expatriate Failure Reasons,' a fishbone (Ishikawa) diagram with the main bone 'Expat Failure' and branches for categories like 'Individual Factors,' 'Family Factors,' 'Organizational Factors,' and 'Host Country Factors.'"
+        'diagram_suggestion': "Diagram Suggestion: A profile of a 'Successful Expatriate' highlighting key qualities in a star or circular diagram. For 'Expatriate Failure Reasons,' a fishbone (Ishikawa) diagram with the main bone 'Expat Failure' and branches for categories like 'Individual Factors,' 'Family Factors,' 'Organizational Factors,' and 'Host Country Factors.'",
+        'diagram': {
+            'type': 'fishbone', 'name': "Reasons for Expatriate Failure",
+            'main_bone': "Expat Failure",
+            'categories': {
+                'Individual Factors': ['Inability to Adapt', 'Immaturity'],
+                'Family Factors': ['Spouse cannot adjust', 'Isolation'],
+                'Organizational Factors': ['Poor Selection', 'Inadequate Training'],
+                'Host Country Factors': ['Lack of Support', 'Cultural Toughness']
+            },
+        },
     },
     {
         'year': 'June 2024',
         'question_number': 4,
         'question_text': "4. Explain the model of expatriate performance management. Why is it important to include hard, soft and contextual goals when assessing managerial performance?",
-        'diagram_suggestion': "Diagram Suggestion: A visual representation of the expatriate performance management model from Unit 7... For the goals, a triangle with 'Hard,' 'Soft,' and 'Contextual' goals at its vertices, with 'Overall Managerial Performance' at the center."
+        'diagram_suggestion': "Diagram Suggestion: A visual representation of the expatriate performance management model from Unit 7... For the goals, a triangle with 'Hard,' 'Soft,' and 'Contextual' goals at its vertices, with 'Overall Managerial Performance' at the center.",
+        'diagram': {
+            'type': 'triangle', 'name': "Expatriate Goal Assessment Model",
+            'vertices': ['Hard Goals\n(Quantitative)', 'Soft Goals\n(Behavioral)', 'Contextual Goals\n(Situational)'],
+            'center_text': "Overall\nManagerial\nPerformance",
+        },
     },
     {
         'year': 'June 2024',
         'question_number': 5,
         'question_text': "5. Discuss the relationship differences in leadership and motivation across cultures to the need for careful selection of expatriate managers. Compare and contrast leadership in France with leadership in the Arab World.",
-        'diagram_suggestion': "Diagram Suggestion: A world map with call-out boxes for different regions ... Or, a two-circle Venn diagram comparing 'Leadership in France' and 'Leadership in Arab World,' showing both commonalities (e.g., hierarchical aspects) and differences."
+        'diagram_suggestion': "Diagram Suggestion: A world map with call-out boxes for different regions ... Or, a two-circle Venn diagram comparing 'Leadership in France' and 'Leadership in Arab World,' showing both commonalities (e.g., hierarchical aspects) and differences.",
+        'diagram': {
+            'type': 'venn2', 'name': "Leadership Comparison",
+            'label1': "Leadership in France", 'label2': "Leadership in Arab World",
+            'overlap_text': "• Hierarchical\n• Centralized",
+            'unique1_text': "• Emphasis on Intellect\n• Formal Communication",
+            'unique2_text': "• Paternalism\n• Personalism/Kinship",
+        },
     },
     # ==================== DECEMBER 2023 ====================
     {
         'year': 'December 2023',
         'question_number': 1,
         'question_text': "1. Describe and discuss any two cultural models and divergence and convergence of cultures.",
-        'diagram_suggestion': "Diagram Suggestion: For Hofstede, the 'Cultural Onion Model' (Values, Rituals, Heroes, Symbols). For Trompenaars, a spider-web diagram showing the seven dimensions. For Convergence/Divergence, two initially separate circles representing cultures, with arrows of 'Globalization' either pushing them to overlap (Convergence) or showing them maintaining distinct spaces despite interaction (Divergence/Crossvergence)."
+        'diagram_suggestion': "Diagram Suggestion: For Hofstede, the 'Cultural Onion Model' (Values, Rituals, Heroes, Symbols). For Trompenaars, a spider-web diagram showing the seven dimensions. For Convergence/Divergence, two initially separate circles representing cultures, with arrows of 'Globalization' either pushing them to overlap (Convergence) or showing them maintaining distinct spaces despite interaction (Divergence/Crossvergence).",
+        'diagram': {
+            'type': 'layers', 'name': "Cultural Models & Dynamics",
+            'layers_title': "Hofstede's Onion Model",
+            'layers': [['Values', 0.2], ['Rituals', 0.4], ['Heroes', 0.6], ['Symbols', 0.8]],
+            'left_label': "Culture A", 'right_label': "Culture B",
+        },
     },
     {
         'year': 'December 2023',
         'question_number': 2,
         'question_text': "2. Who is an expatriate? Discuss the reasons for the failures of an expatriate and how to overcome them, with examples.",
-        'diagram_suggestion': "Diagram Suggestion: A cause-and-effect (fishbone) diagram showing 'Expatriate Failure' as the main effect, with branches for causes like 'Poor Selection,' 'Family Issues,' 'Cultural Inadaptability,' 'Lack of Training,' 'Insufficient Support.' For overcoming, a circular flow diagram showing 'Selection -> Training -> In-Country Support -> Repatriation Planning -> Successful Expat Cycle.'"
+        'diagram_suggestion': "Diagram Suggestion: A cause-and-effect (fishbone) diagram showing 'Expatriate Failure' as the main effect, with branches for causes like 'Poor Selection,' 'Family Issues,' 'Cultural Inadaptability,' 'Lack of Training,' 'Insufficient Support.' For overcoming, a circular flow diagram showing 'Selection -> Training -> In-Country Support -> Repatriation Planning -> Successful Expat Cycle.'",
+        'diagram': {
+            'type': 'fishbone', 'name': "Expatriate Failure Reasons & Solutions",
+            'main_bone': "Expat Failure",
+            'categories': {
+                'Poor Selection': [], 'Family Issues': [],
+                'Cultural Inadaptability': [], 'Lack of Training': []
+            },
+        },
     },
     {
         'year': 'December 2023',
         'question_number': 3,
         'question_text': "3. How can one assess the performance of International employees and what criteria could be adopted for their performance?",
-        'diagram_suggestion': "Diagram Suggestion: A model of IPM (similar to Unit 7) showing inputs (MNC Strategy, Assignment Task, Expat Characteristics) influencing the Expatriate Performance, which is then assessed using a 'Balanced Scorecard' type of approach with quadrants for Hard, Soft, Contextual, and Developmental criteria."
+        'diagram_suggestion': "Diagram Suggestion: A model of IPM (similar to Unit 7) showing inputs (MNC Strategy, Assignment Task, Expat Characteristics) influencing the Expatriate Performance, which is then assessed using a 'Balanced Scorecard' type of approach with quadrants for Hard, Soft, Contextual, and Developmental criteria.",
+        'diagram': {
+            'type': 'matrix', 'name': "Balanced Scorecard for IPM",
+            'xlabel': "Task-Focused ('What')", 'ylabel': "Behavior-Focused ('How')",
+            'q1': "Contextual Criteria\n(Navigating local challenges)", 'q2': "Developmental Criteria\n(Learning, skill growth)",
+            'q3': "Hard Criteria\n(KPIs, sales, profit)", 'q4': "Soft Criteria\n(Leadership, teamwork)",
+            'midpoint': None,
+        },
     },
 ]
 
 # --- HELPER & DRAWING FUNCTIONS ---
 
-def setup_directories():
+def setup_directories(output_dir=OUTPUT_DIR, in_memory_images=IN_MEMORY_IMAGES):
     """Creates the output and temporary image directories."""
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
+    if in_memory_images:
+        return
     if os.path.exists(IMG_DIR):
         shutil.rmtree(IMG_DIR)
     os.makedirs(IMG_DIR)
 
+def open_diagram_cache(output_dir=OUTPUT_DIR):
+    """Returns the persistent diagram cache, or None if unavailable."""
+    path = os.path.join(output_dir, DIAGRAM_CACHE_DIR)
+    try:
+        return RenderCache(path, DIAGRAM_CACHE_MAX_BYTES, suffix=f".{IMAGE_FORMAT}")
+    except OSError as e:
+        print(f"Warning: Diagram cache disabled, could not open {path}: {e}")
+        return None
+
+def diagram_cache_key(item):
+    """Content hash of everything that affects one drawn diagram: its spec,
+       title, drawing function and output settings.
+    """
+    import matplotlib
+    import matplotlib_venn
+    spec = item.get('diagram') or {}
+    renderer = DIAGRAM_RENDERERS.get(spec.get('type'))
+    return RenderCache.make_key(spec, diagram_title(item), renderer and renderer.__name__, IMAGE_FORMAT, DIAGRAM_DPI,
+                                DIAGRAM_RENDERER_VERSION, matplotlib.__version__, matplotlib_venn.__version__)
+
+def open_page_cache(output_dir=OUTPUT_DIR):
+    """Returns the page cache for incremental builds, or None if unavailable."""
+    path = os.path.join(output_dir, PAGE_CACHE_DIR)
+    try:
+        return RenderCache(path, suffix='.pdf')
+    except OSError as e:
+        print(f"Warning: Page cache disabled, could not open {path}: {e}")
+        return None
+
+def diagram_page_key(item, year_title):
+    """Content hash of everything that affects one question's page, including
+       its drawn diagram.
+    """
+    import reportlab
+    drawn = None if is_native_table(item) else diagram_cache_key(item) # Native tables are not drawn
+    return RenderCache.make_key(item, year_title, drawn, image_settings(EMBED_DPI), theme_key(), NATIVE_TABLES,
+                                reportlab.Version)
+
 def cleanup_directories():
     """Removes the temporary image directory."""
     if os.path.exists(IMG_DIR):
@@ -171,9 +381,23 @@ def create_table_image(data, col_widths, title, filepath):
         cell.set_edgecolor('w')
 
     plt.title(title, weight='bold', pad=20, fontsize=14)
-    plt.savefig(filepath, bbox_inches='tight', dpi=150)
+    plt.savefig(filepath, bbox_inches='tight', dpi=DIAGRAM_DPI)
     plt.close()
 
+def create_table_flowable(data, col_widths, title, styles, width=None):
+    """Builds the same table as create_table_image as a reportlab Table with
+       wrapped cells and the #40466e header (styles['table']). col_widths are
+       fractions of width, which defaults to the page's frame width.
+    """
+    if width is None:
+        width = A4[0] - 2 * inch
+    rows = [[cached_paragraph(escape(str(cell)), styles['table_header']) for cell in data[0]]]
+    for row in data[1:]:
+        rows.append([cached_paragraph(escape(str(cell)), styles['table_cell']) for cell in row])
+    table = Table(rows, colWidths=[width * fraction for fraction in col_widths], repeatRows=1)
+    table.setStyle(styles['table'])
+    return KeepTogether([cached_paragraph(escape(title), styles['table_title']), table])
+
 def draw_2x2_matrix(title, xlabel, ylabel, q1, q2, q3, q4, midpoint, filepath):
     """Draws a 2x2 matrix diagram."""
     fig, ax = plt.subplots(figsize=(8, 7))
@@ -200,7 +424,7 @@ def draw_2x2_matrix(title, xlabel, ylabel, q1, q2, q3, q4, midpoint, filepath):
 
     plt.title(title, fontsize=14, weight='bold', pad=20)
     plt.tight_layout()
-    plt.savefig(filepath, bbox_inches='tight', dpi=150)
+    plt.savefig(filepath, bbox_inches='tight', dpi=DIAGRAM_DPI)
     plt.close()
 
 def draw_flowchart(title, steps, filepath):
@@ -220,7 +444,7 @@ def draw_flowchart(title, steps, filepath):
                 (positions[i-1][0] + 0.1, 0.5), (positions[i][0] - 0.1, 0.5),
                 transform=ax.transAxes, **arrow_style
             ))
-    plt.savefig(filepath, bbox_inches='tight', dpi=150)
+    plt.savefig(filepath, bbox_inches='tight', dpi=DIAGRAM_DPI)
     plt.close()
 
 def draw_fishbone(title, main_bone, categories, filepath):
@@ -252,7 +476,7 @@ def draw_fishbone(title, main_bone, categories, filepath):
             ax.text(pos_x - 0.12, pos_y, cause, ha='right', va='center')
             pos_y += 0.08 if pos_y < 0.5 else -0.08 # Shift next cause
 
-    plt.savefig(filepath, bbox_inches='tight', dpi=150)
+    plt.savefig(filepath, bbox_inches='tight', dpi=DIAGRAM_DPI)
     plt.close()
     
 def draw_venn2_diagram(title, label1, label2, overlap_text, unique1_text, unique2_text, filepath):
@@ -271,7 +495,7 @@ def draw_venn2_diagram(title, label1, label2, overlap_text, unique1_text, unique
         if text: text.set_fontsize(10)
 
     plt.title(title, fontsize=16, weight='bold')
-    plt.savefig(filepath, bbox_inches='tight', dpi=150)
+    plt.savefig(filepath, bbox_inches='tight', dpi=DIAGRAM_DPI)
     plt.close()
 
 def draw_conceptual_triangle(title, vertices, center_text, filepath):
@@ -287,25 +511,278 @@ def draw_conceptual_triangle(title, vertices, center_text, filepath):
     ax.text(p3[0]+0.05, p3[1], vertices[2], ha='left', va='center', bbox=dict(fc='lightcoral', pad=5))
     ax.text(0.5, 0.5, center_text, ha='center', va='center', weight='bold', fontsize=12, bbox=dict(fc='gold', boxstyle='circle,pad=0.5'))
 
-    plt.savefig(filepath, bbox_inches='tight', dpi=150)
+    plt.savefig(filepath, bbox_inches='tight', dpi=DIAGRAM_DPI)
     plt.close()
 
+def draw_donut_comparison(title, donut_title, labels, colors, panel_title, left_label, right_label, link_label, filepath):
+    """Draws a donut chart of equal segments beside two linked boxes."""
+    fig = plt.figure(figsize=(12, 6)); fig.suptitle(title, fontsize=16, weight='bold')
+    ax1 = fig.add_subplot(1, 2, 1); ax1.set_title(donut_title, pad=15)
+    ax1.pie([1] * len(labels), labels=labels, colors=colors, autopct='%1.1f%%', startangle=90, wedgeprops=dict(width=0.3, edgecolor='w'))
+    ax1.add_artist(plt.Circle((0,0),0.70,fc='white')); ax1.axis('equal')
+    ax2 = fig.add_subplot(1, 2, 2); ax2.set_title(panel_title, pad=15); ax2.axis('off')
+    ax2.text(0.1, 0.6, left_label, ha='center', bbox=dict(fc='lightgreen')); ax2.text(0.9, 0.6, right_label, ha='center', bbox=dict(fc='lightblue'))
+    ax2.annotate(link_label, xy=(0.7, 0.6), xytext=(0.3, 0.6), arrowprops=dict(arrowstyle='<->', color='red'))
+    plt.tight_layout(rect=[0, 0.03, 1, 0.95]); plt.savefig(filepath, bbox_inches='tight', dpi=DIAGRAM_DPI); plt.close()
+
+def draw_input_output(title, inputs, outputs, filepath):
+    """Draws an inputs box with an arrow to an outcomes box."""
+    fig, ax = plt.subplots(figsize=(10, 2.5)); ax.axis('off'); ax.set_title(title, fontsize=16, weight='bold')
+    source = ax.text(0.2, 0.5, inputs, ha='center', va='center', fontsize=12,
+                     bbox=dict(boxstyle='round,pad=0.8', fc='lightblue'))
+    target = ax.text(0.8, 0.5, outputs, ha='center', va='center', fontsize=12,
+                     bbox=dict(boxstyle='round,pad=0.8', fc='lightgreen'))
+    # Clipped to both boxes, so the arrow runs from edge to edge
+    ax.annotate("", xy=(0.8, 0.5), xytext=(0.2, 0.5),
+                arrowprops=dict(arrowstyle="simple", mutation_scale=30, fc='grey', ec='black',
+                                patchA=source.get_bbox_patch(), patchB=target.get_bbox_patch(), shrinkA=4, shrinkB=4))
+    plt.savefig(filepath, bbox_inches='tight', dpi=DIAGRAM_DPI); plt.close()
+
+def draw_box_diagram(title, boxes, filepath, figsize=(10, 7)):
+    """Draws labelled boxes at axes positions. Each box is a dict with x, y,
+       text and fc, plus optional va, boxstyle and pad.
+    """
+    fig, ax = plt.subplots(figsize=tuple(figsize)); ax.axis('off'); ax.set_title(title, fontsize=16, weight='bold')
+    for box in boxes:
+        bbox = {key: box[key] for key in ('boxstyle', 'fc', 'pad') if key in box}
+        align = {'va': box['va']} if 'va' in box else {}
+        ax.text(box['x'], box['y'], box['text'], ha='center', bbox=bbox, **align)
+    plt.savefig(filepath, bbox_inches='tight', dpi=DIAGRAM_DPI); plt.close()
+
+def draw_layers_convergence(title, layers_title, layers, left_label, right_label, filepath):
+    """Draws concentric layers (innermost first, as [name, radius]) beside two
+       cultures converging under globalization.
+    """
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6)); fig.suptitle(title, fontsize=16, weight='bold')
+    # Onion Model
+    ax1.set_title(layers_title); ax1.set_aspect('equal'); ax1.axis('off')
+    for name, radius in reversed(layers):
+        ax1.add_patch(Circle((0.5, 0.5), radius, fill=False, ec='black'))
+        ax1.text(0.5, 0.5 + radius - 0.1, name, ha='center')
+    # Convergence/Divergence
+    ax2.set_title("Convergence vs. Divergence"); ax2.axis('off')
+    ax2.add_patch(Circle((0.3, 0.5), 0.2, fc='lightblue', alpha=0.6)); ax2.text(0.3, 0.5, left_label, ha='center')
+    ax2.add_patch(Circle((0.7, 0.5), 0.2, fc='lightgreen', alpha=0.6)); ax2.text(0.7, 0.5, right_label, ha='center')
+    ax2.arrow(0.4, 0.7, 0.2, 0, head_width=0.05, color='red'); ax2.arrow(0.6, 0.3, -0.2, 0, head_width=0.05, color='red')
+    ax2.text(0.5, 0.8, "Convergence", ha='center'); ax2.text(0.5, 0.2, "(Globalization)", ha='center', style='italic')
+    plt.savefig(filepath, bbox_inches='tight', dpi=DIAGRAM_DPI); plt.close()
+
+# Diagram spec 'type' -> drawing function, called as function(title=..., filepath=..., **params)
+DIAGRAM_RENDERERS = {
+    'table': create_table_image,
+    'matrix': draw_2x2_matrix,
+    'flowchart': draw_flowchart,
+    'fishbone': draw_fishbone,
+    'venn2': draw_venn2_diagram,
+    'triangle': draw_conceptual_triangle,
+    'donut': draw_donut_comparison,
+    'input_output': draw_input_output,
+    'boxes': draw_box_diagram,
+    'layers': draw_layers_convergence,
+}
+
+def diagram_title(item):
+    """Title drawn on the diagram for one EXAM_DATA item."""
+    title = f"Diagram for Q{item['question_number']} ({item['year']})"
+    spec = item.get('diagram')
+    return f"{title}: {spec['name']}" if spec and spec.get('name') else title
+
+def render_diagram(item, filepath):
+    """Draws the diagram declared by an EXAM_DATA item's spec into filepath
+       (a path or binary file-like object).
+    """
+    spec = item.get('diagram')
+    if not spec:
+        raise NotImplementedError(f"No diagram spec for Q{item['question_number']} ({item['year']}).")
+    renderer = DIAGRAM_RENDERERS.get(spec['type'])
+    if renderer is None:
+        raise ValueError(f"Unknown diagram type '{spec['type']}' for Q{item['question_number']} ({item['year']}).")
+    params = {key: value for key, value in spec.items() if key not in ('type', 'name')}
+    renderer(title=diagram_title(item), filepath=filepath, **params)
+
 # --- MAIN SCRIPT LOGIC ---
 
-def main():
-    """Main function to generate the PDF with diagrams."""
-    print("--- Starting PDF Generation ---")
-    setup_directories()
+def get_styles():
+    """Returns the paragraph and table styles used on every page (shared theme)."""
+    return diagram_styles()
 
-    pdf_path = os.path.join(OUTPUT_DIR, PDF_FILENAME)
-    doc = SimpleDocTemplate(pdf_path, pagesize=A4, rightMargin=inch, leftMargin=inch, topMargin=inch, bottomMargin=inch)
-    story = []
+def make_doc_template(output):
+    return SimpleDocTemplate(output, pagesize=A4, rightMargin=inch, leftMargin=inch, topMargin=inch, bottomMargin=inch)
+
+def is_native_table(item):
+    """True if the item's diagram is laid out as a reportlab Table."""
+    return NATIVE_TABLES and (item.get('diagram') or {}).get('type') == 'table'
+
+def diagram_image_name(item):
+    return f"q{item['question_number']}_{item['year'].replace(' ', '_')}.{IMAGE_FORMAT}"
+
+def _render_diagram_job(job):
+    """Worker entry point: draws one diagram. job is (item, img_path), with
+       img_path None to draw into memory. Returns (image, error): the image
+       bytes or path, or None and the error message if it could not be drawn.
+    """
+    item, img_path = job
+    plt.rcParams['savefig.format'] = IMAGE_FORMAT
+    target = io.BytesIO() if img_path is None else img_path
+    try:
+        render_started = time.perf_counter()
+        render_diagram(item, target)
+        PROFILE.add('diagram render', render_started, question=f"{item['question_number']} ({item['year']})")
+    except Exception as e:
+        plt.close('all')
+        return None, str(e)
+    return (target.getvalue() if img_path is None else img_path), None
+
+def render_diagrams(items, in_memory_images=IN_MEMORY_IMAGES, workers=DIAGRAM_WORKERS, cache=None):
+    """Draws the diagrams of all items up front in a process pool. Returns
+       their (image, error) results in the order of items. Diagrams found in
+       the cache are served from it and never reach the pool. Native tables
+       are not drawn; their result is None.
+    """
+    jobs = [(item, None if in_memory_images else os.path.join(IMG_DIR, diagram_image_name(item))) for item in items]
+    results = [None] * len(jobs)
+    pending = [] # (index, cache key) of jobs that still need drawing
+    with PROFILE.phase('diagram cache'):
+        for index, (item, img_path) in enumerate(jobs):
+            if is_native_table(item):
+                continue
+            key = diagram_cache_key(item) if cache else None
+            cached = cache.get(key) if cache else None
+            if cached is None:
+                pending.append((index, key))
+            elif img_path is None:
+                results[index] = cached, None
+            else:
+                with open(img_path, 'wb') as f:
+                    f.write(cached)
+                results[index] = img_path, None
+
+    if workers > 1 and len(pending) > 1:
+        print(f"Drawing {len(pending)} diagrams with {workers} worker(s)...")
+    rendered = map_in_workers(_render_diagram_job, [jobs[index] for index, _ in pending], workers)
+
+    for (index, key), result in zip(pending, rendered):
+        results[index] = result
+        image, error = result
+        if cache and error is None:
+            try:
+                if isinstance(image, bytes):
+                    cache.put(key, image)
+                else:
+                    with open(image, 'rb') as f:
+                        cache.put(key, f.read())
+            except OSError as e:
+                print(f"Warning: Could not cache diagram for Q{items[index]['question_number']} ({items[index]['year']}): {e}")
+    return results
+
+def question_flowables(item, styles, in_memory_images=IN_MEMORY_IMAGES, year_title=False, rendered=None,
+                       failures=None):
+    """Returns the flowables for one EXAM_DATA item's page: the year heading
+       (first question of a year only), the question text and the diagram, or
+       an error note if it could not be drawn (also appended to failures, if
+       it is a list). rendered is the item's result from render_diagrams();
+       without it the diagram is drawn here.
+    """
+    year = item['year']
+    flowables = []
+    if year_title:
+        flowables.append(cached_paragraph(f"Exam Solutions: {year}", styles['title']))
+        flowables.append(Spacer(1, 0.5 * inch))
+
+    q_num = item['question_number']
+    print(f"Processing: Q{q_num} ({year})")
+    
+    flowables.append(cached_paragraph(item['question_text'], styles['question']))
+    flowables.append(Spacer(1, 0.2 * inch))
+
+    if is_native_table(item):
+        spec = item['diagram']
+        try:
+            with PROFILE.phase('table build', question=f"{q_num} ({year})"):
+                flowables.append(create_table_flowable(spec['data'], spec['col_widths'], diagram_title(item), styles))
+            return flowables
+        except Exception as e:
+            print(f"  -> Native table failed for Q{q_num} ({year}): {e}. Drawing it as an image.")
+            rendered = None
+
+    if rendered is None:
+        rendered = _render_diagram_job((item, None if in_memory_images else os.path.join(IMG_DIR, diagram_image_name(item))))
+    image, error = rendered
+
+    try:
+        if error is not None:
+            raise RuntimeError(error)
+        if isinstance(image, bytes):
+            image = io.BytesIO(image)
+        with PROFILE.phase('image load', question=f"{q_num} ({year})"):
+            if IMAGE_FORMAT == 'svg':
+                img = svg_flowable(image, 7*inch, 5*inch, keep_aspect=True)
+            else:
+                img = embedded_image(image, 7*inch, 5*inch, EMBED_DPI, kind='proportional')
+        flowables.append(img)
+
+    except Exception as e:
+        print(f"  -> ERROR generating diagram for Q{q_num} ({year}): {e}")
+        if failures is not None:
+            failures.append(str(e))
+        flowables.append(cached_paragraph(f"[Error creating diagram: {e}]", styles['body']))
+    
+    return flowables
+
+def diagram_story(sections, styles, in_memory_images, rendered):
+    """Streams the story for (item, year_title) sections, one page each.
+       rendered holds their render_diagrams() results; each entry is cleared
+       once its page is built, so drawn images are not kept for the whole build.
+    """
+    for index, (item, year_title) in enumerate(sections):
+        result, rendered[index] = rendered[index], None
+        yield from question_flowables(item, styles, in_memory_images, year_title, result)
+        yield PageBreak()
+
+def _render_year_job(job):
+    """Worker entry point: lays out one exam year and returns its PDF bytes."""
+    sections, in_memory_images, cache = job
+    rendered = render_diagrams([item for item, _ in sections], in_memory_images, workers=1, cache=cache)
+    return render_section_pdf(diagram_story(sections, get_styles(), in_memory_images, rendered), make_doc_template)
+
+def render_years(jobs, workers):
+    """Renders the per-year jobs in a process pool, results in year order."""
+    return map_in_workers(_render_year_job, jobs, workers)
+
+def build_diagram_report(pdf_path=None, in_memory_images=None, incremental=None, section_workers=None,
+                         page_numbers=None, diagram_workers=None, use_cache=None, purge_cache=False):
+    """Generates the PDF with diagrams and returns its path.
+       pdf_path defaults to OUTPUT_DIR/PDF_FILENAME, and the other arguments to
+       IN_MEMORY_IMAGES, INCREMENTAL_BUILD, SECTION_WORKERS, PAGE_NUMBERS,
+       DIAGRAM_WORKERS and USE_DIAGRAM_CACHE. purge_cache empties the diagram
+       cache first. Raises if the PDF cannot be built.
+    """
+    if pdf_path is None:
+        pdf_path = os.path.join(OUTPUT_DIR, PDF_FILENAME)
+    if in_memory_images is None:
+        in_memory_images = IN_MEMORY_IMAGES
+    if incremental is None:
+        incremental = INCREMENTAL_BUILD
+    if section_workers is None:
+        section_workers = SECTION_WORKERS
+    if page_numbers is None:
+        page_numbers = PAGE_NUMBERS
+    if diagram_workers is None:
+        diagram_workers = DIAGRAM_WORKERS
+    if use_cache is None:
+        use_cache = USE_DIAGRAM_CACHE
+    output_dir = os.path.dirname(os.path.abspath(pdf_path))
+    setup_directories(output_dir, in_memory_images)
+    diagram_cache = open_diagram_cache(output_dir) if use_cache or purge_cache else None
+    if diagram_cache and purge_cache:
+        diagram_cache.clear()
+        print(f"Diagram cache purged: {diagram_cache.directory}")
+        if not use_cache:
+            diagram_cache = None
+    plt.rcParams['savefig.format'] = IMAGE_FORMAT # Used when saving into memory buffers
 
     # Setup styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle('TitleStyle', parent=styles['h1'], fontSize=18, spaceAfter=14, textColor=colors.HexColor('#2C3E50'))
-    question_style = ParagraphStyle('QuestionStyle', parent=styles['h2'], fontSize=12, spaceAfter=10, leading=14, textColor=colors.HexColor('#34495E'))
-    body_style = styles['BodyText']
+    styles = get_styles()
 
     # Group questions by year for easier processing
     exams = {}
@@ -318,204 +795,72 @@ def main():
     # Sort years to process them in order
     sorted_years = sorted(exams.keys())
 
+    sections = [] # (item, year_title) in page order
     for year in sorted_years:
-        story.append(Paragraph(f"Exam Solutions: {year}", title_style))
-        story.append(Spacer(1, 0.5 * inch))
-
-        for item in sorted(exams[year], key=lambda x: x['question_number']):
-            q_num = item['question_number']
-            print(f"Processing: Q{q_num} ({year})")
-            
-            story.append(Paragraph(item['question_text'], question_style))
-            story.append(Spacer(1, 0.2 * inch))
-
-            suggestion = item['diagram_suggestion']
-            img_name = f"q{q_num}_{year.replace(' ', '_')}.png"
-            img_path = os.path.join(IMG_DIR, img_name)
-            
-            numbered_title = f"Diagram for Q{q_num} ({year})"
-
-            try:
-                # =================== DIAGRAM GENERATION ROUTER ===================
-                
-                # --- June 2023 ---
-                if year == 'June 2023' and q_num == 1:
-                    numbered_title += ": DHRM vs IHRM & EPRG Framework"
-                    create_table_image([
-                        ['Parameter', 'Domestic HRM (DHRM)', 'International HRM (IHRM)'],
-                        ['Scope', 'National', 'Global (Multiple Countries)'],
-                        ['Activities', 'Standard HR Functions', 'Adds intl. tax, relocation, family support'],
-                        ['Risk', 'Lower (e.g., legal compliance)', 'Higher (e.g., expat failure, political)'],
-                    ], [0.2, 0.4, 0.4], numbered_title, img_path)
-
-                elif year == 'June 2023' and q_num == 2:
-                    numbered_title += ": MNC Competitive Strategies"
-                    draw_2x2_matrix(numbered_title, "Pressure for Local Responsiveness", "Pressure for Global Integration",
-                                     "Global Strategy\n(High Integration,\nLow Responsiveness)",
-                                     "Transnational Strategy\n(High Integration,\nHigh Responsiveness)",
-                                     "International Strategy\n(Low Integration,\nLow Responsiveness)",
-                                     "Multidomestic Strategy\n(Low Integration,\nHigh Responsiveness)",
-                                     "Regional\n(Mid-point)", img_path)
-                
-                elif year == 'June 2023' and q_num == 3:
-                    numbered_title += ": International Assignment Training Timeline"
-                    draw_flowchart(numbered_title,
-                                   ['Pre-Departure\n(Cultural, Language,\nPractical Training)',
-                                    'In-Country\n(Mentorship, Ongoing\nSupport, Coaching)',
-                                    'Pre-Repatriation\n(Career Planning,\nReverse Culture Shock)'], img_path)
-
-                elif year == 'June 2023' and q_num == 4:
-                    numbered_title += ": Total Rewards & Taxation Challenges"
-                    # Combined Diagram
-                    fig = plt.figure(figsize=(12, 6)); fig.suptitle(numbered_title, fontsize=16, weight='bold')
-                    ax1 = fig.add_subplot(1, 2, 1); ax1.set_title("Total Rewards System", pad=15)
-                    ax1.pie([1, 1], labels=['Financial', 'Non-Financial'], colors=['#ff9999','#66b3ff'], autopct='%1.1f%%', startangle=90, wedgeprops=dict(width=0.3, edgecolor='w'))
-                    ax1.add_artist(plt.Circle((0,0),0.70,fc='white')); ax1.axis('equal')
-                    ax2 = fig.add_subplot(1, 2, 2); ax2.set_title("Intl. Taxation Challenges", pad=15); ax2.axis('off')
-                    ax2.text(0.1, 0.6, 'Home Country', ha='center', bbox=dict(fc='lightgreen')); ax2.text(0.9, 0.6, 'Host Country', ha='center', bbox=dict(fc='lightblue'))
-                    ax2.annotate('Double Tax Liability', xy=(0.7, 0.6), xytext=(0.3, 0.6), arrowprops=dict(arrowstyle='<->', color='red'))
-                    plt.tight_layout(rect=[0, 0.03, 1, 0.95]); plt.savefig(img_path, bbox_inches='tight', dpi=150); plt.close()
-
-                elif year == 'June 2023' and q_num == 5:
-                    numbered_title += ": Motivation Theories in an International Context"
-                    table_data = [
-                        ['Theory', 'Key Tenets', 'Cross-Cultural Considerations'],
-                        ['Maslow\'s Hierarchy', 'Needs are hierarchical', 'Hierarchy & salience of needs can vary culturally.'],
-                        ['Herzberg\'s Two-Factor', 'Hygiene vs. Motivator factors', 'What constitutes a motivator is culturally dependent.'],
-                        ['Expectancy Theory', 'Effort -> Performance -> Reward', 'Valence of rewards is culturally influenced.'],
-                        ['Equity Theory', 'Fair input/output ratio vs. others', 'Concept of fairness and comparison group varies.']
-                    ]
-                    create_table_image(table_data, [0.15, 0.35, 0.5], numbered_title, img_path)
-
-                elif year == 'June 2023' and q_num == 6:
-                    numbered_title += ": Relationship between HPWS and HPO"
-                    fig, ax = plt.subplots(figsize=(10, 5)); ax.axis('off'); ax.set_title(numbered_title, fontsize=16, weight='bold')
-                    hpws_items = "Inputs (HPWS):\n• Selective Hiring\n• Empowerment\n• Info Sharing"
-                    ax.text(0.2, 0.5, hpws_items, ha='center', va='center', bbox=dict(boxstyle='round', fc='lightblue', pad=10))
-                    ax.annotate("", xy=(0.7, 0.5), xytext=(0.4, 0.5), arrowprops=dict(arrowstyle="=>", mutation_scale=30, lw=3))
-                    hpo_items = "Outcomes (HPO):\n• Superior Results\n• Adaptability\n• Innovation"
-                    ax.text(0.8, 0.5, hpo_items, ha='center', va='center', bbox=dict(boxstyle='round', fc='lightgreen', pad=10))
-                    plt.savefig(img_path, bbox_inches='tight', dpi=150); plt.close()
-                
-                elif year == 'June 2023' and q_num == 7:
-                    numbered_title += ": Role of Employer's Associations"
-                    fig, ax = plt.subplots(figsize=(10, 7)); ax.axis('off'); ax.set_title(numbered_title, fontsize=16, weight='bold')
-                    ax.text(0.5, 0.1, 'MNC', ha='center', bbox=dict(fc='gold', pad=5))
-                    ax.text(0.2, 0.4, "Host Country Environment", ha='center', bbox=dict(fc='lightgrey'))
-                    ax.text(0.8, 0.4, "National Employer\nAssociation", ha='center', bbox=dict(fc='lightgrey'))
-                    ax.text(0.5, 0.7, "International Employer Association", ha='center', bbox=dict(fc='lightblue'))
-                    ax.text(0.5, 0.9, "Supranational Bodies\n(EU, ILO, OECD)", ha='center', bbox=dict(fc='lightgreen'))
-                    plt.savefig(img_path, bbox_inches='tight', dpi=150); plt.close()
-
-                elif year == 'June 2023' and q_num == 8:
-                    numbered_title += ": IHRM Trends, Challenges, and Strategies"
-                    fig, ax = plt.subplots(figsize=(10, 8)); ax.axis('off'); ax.set_title(numbered_title, fontsize=16, weight='bold')
-                    ax.text(0.5, 0.5, "IHRM", ha='center', va='center', bbox=dict(boxstyle='circle', fc='gold', pad=10))
-                    ax.text(0.1, 0.8, "Trends:\n- Globalization\n- Tech", ha='center', bbox=dict(fc='lightblue'))
-                    ax.text(0.9, 0.8, "Challenges:\n- Culture\n- Talent Mgt.", ha='center', bbox=dict(fc='lightcoral'))
-                    ax.text(0.5, 0.1, "Strategies:\n- Global Mindset\n- Leverage Tech", ha='center', bbox=dict(fc='lightgreen'))
-                    plt.savefig(img_path, bbox_inches='tight', dpi=150); plt.close()
-
-                # --- June 2024 ---
-                elif year == 'June 2024' and q_num == 1:
-                    numbered_title += ": DHRM vs. IHRM"
-                    draw_venn2_diagram(numbered_title, "DHRM", "IHRM",
-                                        "Core HR Functions\n(Recruit, Train, etc.)",
-                                        "• Single National Context\n• Lower Risk & Complexity",
-                                        "• Multiple Countries\n• Additional Activities (Tax)\n• Higher Risk & Complexity",
-                                        img_path)
-
-                elif year == 'June 2024' and q_num == 2:
-                    numbered_title += ": Cultural Differences"
-                    table_data = [
-                        ['Aspect', 'Individualistic Society', 'Collectivist Society'],
-                        ['Self-Concept', "'I' identity, personal uniqueness", "'We' identity, group membership"],
-                        ['Goals', 'Personal achievement, self-interest', 'Group goals, harmony, loyalty'],
-                        ['Relationships', 'Loose ties, nuclear family focus', 'Strong, cohesive in-groups'],
-                    ]
-                    create_table_image(table_data, [0.2, 0.4, 0.4], numbered_title, img_path)
-                    
-                elif year == 'June 2024' and q_num == 3:
-                    numbered_title += ": Reasons for Expatriate Failure"
-                    draw_fishbone(numbered_title, "Expat Failure",
-                                  {
-                                      'Individual Factors': ['Inability to Adapt', 'Immaturity'],
-                                      'Family Factors': ['Spouse cannot adjust', 'Isolation'],
-                                      'Organizational Factors': ['Poor Selection', 'Inadequate Training'],
-                                      'Host Country Factors': ['Lack of Support', 'Cultural Toughness']
-                                  }, img_path)
-
-                elif year == 'June 2024' and q_num == 4:
-                    numbered_title += ": Expatriate Goal Assessment Model"
-                    draw_conceptual_triangle(numbered_title,
-                                             ['Hard Goals\n(Quantitative)', 'Soft Goals\n(Behavioral)', 'Contextual Goals\n(Situational)'],
-                                             "Overall\nManagerial\nPerformance",
-                                             img_path)
-
-                elif year == 'June 2024' and q_num == 5:
-                    numbered_title += ": Leadership Comparison"
-                    draw_venn2_diagram(numbered_title, "Leadership in France", "Leadership in Arab World",
-                                        "• Hierarchical\n• Centralized",
-                                        "• Emphasis on Intellect\n• Formal Communication",
-                                        "• Paternalism\n• Personalism/Kinship",
-                                        img_path)
-
-                # --- December 2023 ---
-                elif year == 'December 2023' and q_num == 1:
-                    numbered_title += ": Cultural Models & Dynamics"
-                    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6)); fig.suptitle(numbered_title, fontsize=16, weight='bold')
-                    # Onion Model
-                    ax1.set_title("Hofstede's Onion Model"); ax1.set_aspect('equal'); ax1.axis('off')
-                    layers = [('Values', 0.2), ('Rituals', 0.4), ('Heroes', 0.6), ('Symbols', 0.8)]
-                    for name, radius in reversed(layers):
-                        ax1.add_patch(Circle((0.5, 0.5), radius, fill=False, ec='black'))
-                        ax1.text(0.5, 0.5 + radius - 0.1, name, ha='center')
-                    # Convergence/Divergence
-                    ax2.set_title("Convergence vs. Divergence"); ax2.axis('off')
-                    ax2.add_patch(Circle((0.3, 0.5), 0.2, fc='lightblue', alpha=0.6)); ax2.text(0.3, 0.5, "Culture A", ha='center')
-                    ax2.add_patch(Circle((0.7, 0.5), 0.2, fc='lightgreen', alpha=0.6)); ax2.text(0.7, 0.5, "Culture B", ha='center')
-                    ax2.arrow(0.4, 0.7, 0.2, 0, head_width=0.05, color='red'); ax2.arrow(0.6, 0.3, -0.2, 0, head_width=0.05, color='red')
-                    ax2.text(0.5, 0.8, "Convergence", ha='center'); ax2.text(0.5, 0.2, "(Globalization)", ha='center', style='italic')
-                    plt.savefig(img_path, bbox_inches='tight', dpi=150); plt.close()
-
-                elif year == 'December 2023' and q_num == 2:
-                    numbered_title += ": Expatriate Failure Reasons & Solutions"
-                    draw_fishbone(numbered_title, "Expat Failure",
-                        {
-                            'Poor Selection': [], 'Family Issues': [], 
-                            'Cultural Inadaptability': [], 'Lack of Training': []
-                        }, img_path)
-
-                elif year == 'December 2023' and q_num == 3:
-                    numbered_title += ": Balanced Scorecard for IPM"
-                    draw_2x2_matrix(numbered_title, "Task-Focused ('What')", "Behavior-Focused ('How')",
-                                   "Contextual Criteria\n(Navigating local challenges)", "Developmental Criteria\n(Learning, skill growth)",
-                                   "Hard Criteria\n(KPIs, sales, profit)", "Soft Criteria\n(Leadership, teamwork)",
-                                   None, img_path)
-
-                else:
-                    raise NotImplementedError(f"No specific diagram logic for Q{q_num} ({year}).")
-                
-                img = Image(img_path, width=7*inch, height=5*inch, kind='proportional')
-                story.append(img)
-
-            except Exception as e:
-                print(f"  -> ERROR generating diagram for Q{q_num} ({year}): {e}")
-                story.append(Paragraph(f"[Error creating diagram: {e}]", body_style))
-            
-            story.append(PageBreak())
+        for index, item in enumerate(sorted(exams[year], key=lambda x: x['question_number'])):
+            sections.append((item, index == 0)) # The year title goes with its first question
 
     # Build the PDF
     try:
-        doc.build(story)
+        if incremental:
+            page_cache = open_page_cache(output_dir)
+            rendered = {}
+            def build_page(index, item, year_title):
+                # Pages with an error note instead of their diagram are not cached
+                failures = []
+                flowables = question_flowables(item, styles, in_memory_images, year_title, rendered[index], failures)
+                return flowables, not failures
+            def render_missing(indexes):
+                results = render_diagrams([sections[index][0] for index in indexes], in_memory_images, diagram_workers,
+                                          diagram_cache)
+                rendered.update(zip(indexes, results))
+            keyed_sections = [(diagram_page_key(item, year_title), partial(build_page, index, item, year_title))
+                              for index, (item, year_title) in enumerate(sections)]
+            rebuilt = build_sections(keyed_sections, make_doc_template, pdf_path, page_cache,
+                                     prepare=render_missing, page_numbers=page_numbers)
+            print(f"Laid out {rebuilt} of {len(sections)} pages, reused the rest.")
+        elif section_workers > 1:
+            jobs = [(list(group), in_memory_images, diagram_cache)
+                    for _, group in groupby(sections, key=lambda s: s[0]['year'])]
+            print(f"Laying out {len(jobs)} exam years with {section_workers} worker(s)...")
+            stitch_pdfs(render_years(jobs, section_workers), pdf_path, page_numbers)
+        else:
+            rendered = render_diagrams([item for item, _ in sections], in_memory_images, diagram_workers, diagram_cache)
+            story = diagram_story(sections, styles, in_memory_images, rendered)
+            if page_numbers:
+                stitch_pdfs([render_section_pdf(story, make_doc_template)], pdf_path, page_numbers=True)
+            else:
+                build_doc(make_doc_template(pdf_path), story)
+    finally:
+        if not in_memory_images:
+            cleanup_directories()
+            print("Temporary files cleaned up.")
+    if diagram_cache and (incremental or section_workers <= 1): # Section workers count their own hits
+        print(f"Diagram cache: {diagram_cache.summary()}")
+    return pdf_path
+
+def main(argv=None):
+    """Main function to generate the PDF with diagrams."""
+    import argparse
+    parser = argparse.ArgumentParser(description="Generate the diagram solutions PDF.")
+    parser.add_argument('--workers', type=int, default=DIAGRAM_WORKERS, help="diagram drawing processes (1 = serial)")
+    parser.add_argument('--no-cache', action='store_true', help="do not reuse or store cached diagrams")
+    parser.add_argument('--purge-cache', action='store_true', help="empty the diagram cache before building")
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+    start_profile(args)
+
+    print("--- Starting PDF Generation ---")
+    try:
+        pdf_path = build_diagram_report(diagram_workers=args.workers, use_cache=not args.no_cache,
+                                        purge_cache=args.purge_cache)
         print(f"\n--- PDF Generation Complete ---")
         print(f"Successfully saved to: {pdf_path}")
     except Exception as e:
         print(f"\n--- PDF GENERATION FAILED ---")
         print(f"Error: {e}")
     finally:
-        cleanup_directories()
-        print("Temporary files cleaned up.")
+        finish_profile(args, generator='diagram')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,316 @@
+"""Benchmarks for the report generators.
+
+Times the full survey (chapter_5.py), diagram (diagram.py) and exam solutions
+(Sample1.py) pipelines on synthetic data at several sizes, plus micro-benchmarks
+for every chart and diagram drawing function. Everything is written to a
+temporary directory, and the results are emitted as JSON so two runs can be
+compared:
+
+    python benchmarks/run_benchmarks.py --output before.json
+    ... change something ...
+    python benchmarks/run_benchmarks.py --output after.json --compare before.json
+
+With --compare the script exits with status 1 if any benchmark's median got
+slower than --threshold times the baseline, so it can gate regressions.
+
+Synthetic EXAM_DATA and exam papers repeat the real questions (and their
+diagram specs).
+"""
+import argparse
+import contextlib
+import copy
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+from report_common import add_generator_paths
+
+add_generator_paths()
+
+DEFAULT_SIZES = [20, 200, 2000]
+SEED = 20240601 # Synthetic data is identical on every run
+
+WORDS = ("customer policy renewal premium service trust agent claim support digital "
+         "channel loyalty value benefit satisfaction experience communication plan").split()
+
+
+# --- Synthetic data ---
+
+def synthetic_survey_data(num_questions, seed=SEED):
+    """Survey questions shaped like chapter_5.survey_data: mostly single-choice
+       pie questions, every fifth one a multi-select bar question, and every
+       twentieth one open-ended (no data).
+    """
+    rng = random.Random(seed)
+    questions = []
+    for q_num in range(1, num_questions + 1):
+        item = {
+            'question_num': q_num,
+            'question_text': f"Question {q_num}: " + " ".join(rng.choices(WORDS, k=rng.randint(5, 14))) + "?",
+            'interpretation': " ".join(rng.choices(WORDS, k=rng.randint(40, 90))).capitalize() + ".",
+        }
+        if q_num % 20 != 0:
+            options = [f"Option {chr(65 + i)} " + rng.choice(WORDS) for i in range(rng.randint(2, 7))]
+            if q_num % 5 == 0:
+                item['data'] = {option: rng.randint(5, 80) for option in options}
+                item['chart_type'] = 'bar'
+                item['multi_select'] = True
+            else:
+                weights = [rng.random() for _ in options]
+                item['data'] = {option: round(w / sum(weights) * 100) for option, w in zip(options, weights)}
+                item['chart_type'] = 'pie'
+        questions.append(item)
+    return questions
+
+def synthetic_exam_data(num_questions, exam_data):
+    """Repeats the real EXAM_DATA entries until there are num_questions."""
+    return [copy.deepcopy(exam_data[index % len(exam_data)]) for index in range(num_questions)]
+
+def write_synthetic_paper(num_questions, source_path, path):
+    """Writes a paper file that repeats the questions of source_path, renumbered,
+       until there are num_questions.
+    """
+    with open(source_path, encoding='utf-8') as f:
+        header, *records = [json.loads(line) for line in f if line.strip()]
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(header) + "\n")
+        for index in range(num_questions):
+            record = dict(records[index % len(records)], number=index + 1)
+            record.pop('space_after', None)
+            f.write(json.dumps(record) + "\n")
+    return path
+
+
+# --- Timing ---
+
+@contextlib.contextmanager
+def quiet():
+    """Hides the generators' progress output; the harness reports to stderr."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+def time_call(function, repeat, setup=None):
+    """Runs function repeat times and returns the wall times in seconds.
+       setup, if given, runs untimed before each call.
+    """
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        with quiet():
+            function()
+        times.append(time.perf_counter() - started)
+    return times
+
+def result(name, times, **info):
+    entry = dict(name=name, **info)
+    entry.update(runs=len(times), min_s=round(min(times), 6), median_s=round(statistics.median(times), 6),
+                 times_s=[round(t, 6) for t in times])
+    print(f"  {name:<44}{' size ' + str(info['size']) if 'size' in info else '':<12}"
+          f"median {entry['median_s']:.4f}s", file=sys.stderr)
+    return entry
+
+
+# --- Pipelines ---
+
+def bench_survey_pipeline(sizes, repeat, workdir, workers):
+    import chapter_5
+    results = []
+    for size in sizes:
+        data = synthetic_survey_data(size)
+        output = os.path.join(workdir, f"survey_{size}.pdf")
+        options = {
+            'chart_dir': os.path.join(workdir, 'charts'),
+            'chart_workers': workers,
+            'use_chart_cache': False, # Measure rendering, not the cache
+        }
+        times = time_call(lambda: chapter_5.build_survey_report(data, output, options), repeat)
+        results.append(result('survey.pipeline', times, size=size, workers=workers))
+    chapter_5.shutdown_chart_workers()
+    return results
+
+def bench_diagram_pipeline(sizes, repeat, workdir):
+    import diagram
+    results = []
+    original = diagram.EXAM_DATA
+    try:
+        for size in sizes:
+            diagram.EXAM_DATA = synthetic_exam_data(size, original)
+            output = os.path.join(workdir, f"diagram_{size}.pdf")
+            times = time_call(lambda: diagram.build_diagram_report(output, in_memory_images=True, incremental=False,
+                                                                   use_cache=False), repeat)
+            results.append(result('diagram.pipeline', times, size=size))
+    finally:
+        diagram.EXAM_DATA = original
+    return results
+
+def bench_exam_pipeline(sizes, repeat, workdir):
+    import Sample1
+    results = []
+    for size in sizes:
+        paper = write_synthetic_paper(size, Sample1.PAPER_PATH, os.path.join(workdir, f"paper_{size}.jsonl"))
+        output = os.path.join(workdir, f"exam_{size}.pdf")
+        times = time_call(lambda: Sample1.generate_exam_solutions_pdf(output, paper), repeat)
+        results.append(result('exam.pipeline', times, size=size))
+    return results
+
+
+# --- Micro-benchmarks ---
+
+def micro_benchmarks():
+    """(name, function[, setup]) entries; each function draws or lays out once,
+       into a memory buffer, and setup runs before each timed call.
+    """
+    import chapter_5
+    import diagram
+    import Sample1
+    import matplotlib.pyplot as plt
+    from report_common import clear_paragraph_cache
+    plt.rcParams['savefig.format'] = 'png'
+
+    summaries = chapter_5.summarize_questions(synthetic_survey_data(5), chapter_5.DEFAULT_OPTIONS)
+    pie, bar = summaries[1], summaries[5]
+    from reportlab.pdfgen.canvas import Canvas
+    styles = diagram.get_styles()
+    canvas = Canvas(io.BytesIO()) # wrapOn() needs one to measure text
+    table = [['Parameter', 'Domestic HRM', 'International HRM'],
+             ['Scope', 'National', 'Global'],
+             ['Risk', 'Lower', 'Higher']]
+    record = list(Sample1.iter_paper())[1]
+    exam_styles = Sample1.get_styles()
+    table_layout = lambda: diagram.create_table_flowable(table, [0.2, 0.4, 0.4], "Table", styles).wrapOn(
+        canvas, 6 * 72, 9 * 72)
+    question_layout = lambda: [flowable.wrapOn(canvas, 6 * 72, 9 * 72)
+                               for flowable in Sample1.question_flowables(record, exam_styles)]
+    # Text layout is timed with an empty paragraph cache (so parsing and line
+    # breaking are measured); the '[warm cache]' entries time the cache hits
+    cold = clear_paragraph_cache
+    benchmarks = [
+        ('chapter_5.create_chart[pie]', lambda: chapter_5.create_chart(pie, io.BytesIO(), '1')),
+        ('chapter_5.create_chart[bar]', lambda: chapter_5.create_chart(bar, io.BytesIO(), '5')),
+        ('chapter_5.create_chart_drawing[pie]', lambda: chapter_5.create_chart_drawing(pie, 324, 227, '1')),
+        ('chapter_5.build_question_table', lambda: chapter_5.build_question_table(pie), cold),
+        ('diagram.create_table_flowable', table_layout, cold),
+        ('diagram.create_table_flowable[warm cache]', table_layout),
+        ('Sample1.question_layout', question_layout, cold),
+        ('Sample1.question_layout[warm cache]', question_layout),
+    ]
+    # Every diagram type, drawn from the first EXAM_DATA spec that uses it
+    specs = {}
+    for item in diagram.EXAM_DATA:
+        specs.setdefault((item.get('diagram') or {}).get('type'), item)
+    for diagram_type, renderer in diagram.DIAGRAM_RENDERERS.items():
+        if diagram_type not in specs:
+            raise ValueError(f"No EXAM_DATA diagram of type '{diagram_type}' to benchmark {renderer.__name__} with")
+        benchmarks.append((f"diagram.{renderer.__name__}",
+                           lambda item=specs[diagram_type]: diagram.render_diagram(item, io.BytesIO())))
+    return benchmarks
+
+def bench_micro(repeat):
+    results = []
+    for name, function, *setup in micro_benchmarks():
+        with quiet():
+            function() # Warm-up: imports, font cache
+        results.append(result(name, time_call(function, repeat, *setup)))
+    return results
+
+
+# --- Reporting ---
+
+def environment():
+    import matplotlib
+    import reportlab
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'matplotlib': matplotlib.__version__,
+        'reportlab': reportlab.Version,
+    }
+
+def compare(results, baseline, threshold):
+    """Prints median changes against a baseline run and returns the regressions."""
+    def key(entry):
+        return entry['name'], entry.get('size')
+    before = {key(entry): entry for entry in baseline['results']}
+    regressions = []
+    print(f"\nComparison with {baseline['environment'].get('commit')} (threshold x{threshold}):", file=sys.stderr)
+    for entry in results:
+        old = before.get(key(entry))
+        if old is None:
+            continue
+        ratio = entry['median_s'] / old['median_s'] if old['median_s'] else float('inf')
+        flag = "  REGRESSION" if ratio > threshold else ""
+        print(f"  {entry['name']:<44}{entry.get('size') or '':<8}{old['median_s']:.4f}s -> "
+              f"{entry['median_s']:.4f}s  x{ratio:.2f}{flag}", file=sys.stderr)
+        if ratio > threshold:
+            regressions.append({'name': entry['name'], 'size': entry.get('size'), 'ratio': round(ratio, 3)})
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the report generators.")
+    parser.add_argument('--sizes', default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated question counts for the pipeline benchmarks")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per pipeline benchmark")
+    parser.add_argument('--micro-repeat', type=int, default=10, help="runs per micro-benchmark")
+    parser.add_argument('--workers', type=int, default=1, help="chart workers for the survey pipeline")
+    parser.add_argument('--only', choices=['survey', 'diagram', 'exam', 'micro'], action='append',
+                        help="run only these groups (repeatable)")
+    parser.add_argument('--output', help="write the JSON results here (default: stdout)")
+    parser.add_argument('--compare', metavar='BASELINE', help="JSON results of an earlier run to compare with")
+    parser.add_argument('--threshold', type=float, default=1.2, help="slowdown ratio counted as a regression")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+    groups = args.only or ['survey', 'diagram', 'exam', 'micro']
+    results = []
+    with tempfile.TemporaryDirectory(prefix='report_bench_') as workdir:
+        print(f"Benchmarking {', '.join(groups)} in {workdir}", file=sys.stderr)
+        if 'survey' in groups:
+            results += bench_survey_pipeline(sizes, args.repeat, workdir, args.workers)
+        if 'diagram' in groups:
+            results += bench_diagram_pipeline(sizes, args.repeat, workdir)
+        if 'exam' in groups:
+            results += bench_exam_pipeline(sizes, args.repeat, workdir)
+        if 'micro' in groups:
+            results += bench_micro(args.micro_repeat)
+
+    report = {'environment': environment(), 'results': results}
+    exit_code = 0
+    if baseline is not None:
+        report['regressions'] = compare(results, baseline, args.threshold)
+        exit_code = 1 if report['regressions'] else 0
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to: {args.output}", file=sys.stderr)
+    else:
+        print(json.dumps(report, indent=2))
+    return exit_code
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
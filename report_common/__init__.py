@@ -0,0 +1,12 @@
+"""Helpers shared by the report generators (survey, diagram and exam solutions)."""
+
+from .cache import RenderCache
+from .incremental import build_sections, number_pages, render_section_pdf, stitch_pdfs
+from .vector import svg_flowable
+from .profiling import PROFILE, add_profile_arguments, build_doc, finish_profile, run_profiled, start_profile
+from .images import embedded_image, image_settings
+from .paths import add_generator_paths
+from .paragraphs import cached_paragraph, clear_paragraph_cache, paragraph_cache_info
+from .streaming import FlowableStream
+from .styles import diagram_styles, exam_styles, fonts, survey_styles, theme_key
+from .workers import WorkerPool, map_in_workers
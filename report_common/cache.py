@@ -0,0 +1,92 @@
+import hashlib
+import json
+import os
+
+
+class RenderCache:
+    """Persistent, size-bounded store for rendered artifacts (charts, diagrams).
+
+    Entries are plain files named after the SHA-256 of their inputs, so a key only
+    changes when the data or the rendering settings change. Reading an entry
+    refreshes its modification time, and once the directory grows past max_bytes
+    the least recently used entries are deleted first.
+    """
+
+    def __init__(self, directory, max_bytes=100 * 1024 * 1024, suffix='.bin'):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+        self._size = sum(size for _, _, size in self._entries())
+
+    @staticmethod
+    def make_key(*parts):
+        """Hashes any JSON-serialisable inputs into a cache key.
+           Dict order is kept on purpose: it decides label order and colours.
+        """
+        payload = json.dumps(parts, default=str, separators=(',', ':'))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + self.suffix)
+
+    def _entries(self):
+        """Yields (path, mtime, size) for every entry in the cache directory."""
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(self.suffix):
+                    stat = entry.stat()
+                    yield entry.path, stat.st_mtime, stat.st_size
+
+    def get(self, key):
+        """Returns the cached bytes for key, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)  # Mark as recently used for LRU eviction
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def put(self, key, data):
+        """Stores data under key, then evicts old entries if over the size limit."""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            old_size = os.path.getsize(path)
+        except OSError:
+            old_size = 0
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)  # Atomic, so concurrent builds never read half a file
+        self._size += len(data) - old_size
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        """Deletes least recently used entries until the cache fits max_bytes."""
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        self._size = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if self._size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                self._size -= size
+            except OSError:
+                pass
+
+    def clear(self):
+        """Removes every entry from the cache."""
+        for path, _, _ in list(self._entries()):
+            os.remove(path)
+        self._size = 0
+
+    def summary(self):
+        return (f"{self.hits} hits, {self.misses} misses "
+                f"({self._size / (1024 * 1024):.1f} MB in {self.directory})")
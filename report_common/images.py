@@ -0,0 +1,127 @@
+"""Raster images sized for the page before they are embedded in the PDF.
+
+Charts are drawn at 300 dpi and diagrams at up to 12x8 inches, then scaled
+down into their boxes on the page, so embedding them as drawn stores far
+more pixels than the page can show. embedded_image() resamples a raster to
+its placed size at a target effective dpi and picks how it is stored:
+
+- an alpha channel that is fully opaque (matplotlib's default) is dropped,
+  otherwise reportlab embeds it as a separate soft mask;
+- images whose pixels are all grey are stored with one channel instead of three;
+- photographic images (more than JPEG_MIN_COLORS distinct colours) are stored
+  as JPEG, everything else (line art, text, charts) losslessly with Flate.
+
+Results are memoised on the source bytes, so byte-identical images are only
+resampled once and reach the PDF as identical image data, which reportlab
+stores once. Vector images (svg_flowable) are not touched.
+"""
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+
+EMBED_FORMAT = 'auto' # 'auto', 'png' (lossless Flate) or 'jpeg'
+JPEG_QUALITY = 85
+JPEG_MIN_COLORS = 32768 # 'auto' stores images with more distinct colours as JPEG
+RESAMPLE_MIN_RATIO = 1.2 # Smaller reductions blur lines without making the PDF smaller
+EMBED_CACHE_SIZE = 64 # Resampled images kept for reuse, per process
+IMAGE_PIPELINE_VERSION = 1 # Bump whenever fit_image's output changes
+
+_fitted = OrderedDict() # (digest, box, settings) -> (data, placed size)
+_fitted_lock = threading.Lock()
+
+
+def image_settings(dpi):
+    """Everything that changes the embedded images, for page cache keys."""
+    return dpi, EMBED_FORMAT, JPEG_QUALITY, JPEG_MIN_COLORS, RESAMPLE_MIN_RATIO, IMAGE_PIPELINE_VERSION
+
+
+def read_image_source(source):
+    """Returns the bytes of a path, bytes or binary file-like image source."""
+    if isinstance(source, bytes):
+        return source
+    if hasattr(source, 'getvalue'):
+        return source.getvalue()
+    if hasattr(source, 'read'):
+        return source.read()
+    with open(source, 'rb') as f:
+        return f.read()
+
+
+def placed_size(image_size, width, height, kind='direct'):
+    """Size in points an image of image_size pixels is drawn at by a reportlab
+       Image(width=width, height=height, kind=kind).
+    """
+    if kind in ('bound', 'proportional'):
+        factor = min(width / image_size[0], height / image_size[1])
+        return image_size[0] * factor, image_size[1] * factor
+    return width, height
+
+
+def _encode(im, image_format):
+    from PIL import Image, ImageChops
+
+    if im.mode in ('RGBA', 'LA') and im.getchannel('A').getextrema() == (255, 255):
+        im = im.convert(im.mode[:-1])
+    elif im.mode not in ('RGB', 'RGBA', 'L', 'LA'): # Palette, CMYK, 16-bit...
+        im = im.convert('RGBA' if 'transparency' in im.info else 'RGB')
+    if im.mode == 'RGB' and ImageChops.difference(im, im.convert('L').convert('RGB')).getbbox() is None:
+        im = im.convert('L')
+    if image_format == 'auto':
+        photographic = im.mode in ('RGB', 'L') and im.getcolors(JPEG_MIN_COLORS) is None
+        image_format = 'jpeg' if photographic else 'png'
+    buffer = io.BytesIO()
+    if image_format == 'jpeg' and im.mode in ('RGB', 'L'):
+        im.save(buffer, 'JPEG', quality=JPEG_QUALITY, optimize=True)
+    else:
+        # reportlab re-compresses the pixels with Flate, so a fast PNG level is enough
+        im.save(buffer, 'PNG', compress_level=1)
+    return buffer.getvalue()
+
+
+def fit_image(data, width, height, dpi, kind='direct', image_format=None):
+    """Resamples image bytes to the pixels needed to draw them at width x
+       height points (see placed_size) at dpi, never enlarging them (nor
+       shrinking them by less than RESAMPLE_MIN_RATIO), and
+       encodes the result as described above. Returns (bytes, (w, h)), where
+       (w, h) is the placed size in points.
+    """
+    # Requires: pip install pillow (already needed by reportlab for PNG images)
+    from PIL import Image
+
+    image_format = image_format or EMBED_FORMAT
+    key = (hashlib.sha256(data).digest(), width, height, kind, dpi, image_format) + image_settings(dpi)[1:]
+    with _fitted_lock:
+        fitted = _fitted.get(key)
+        if fitted is not None:
+            _fitted.move_to_end(key)
+            return fitted
+
+    with Image.open(io.BytesIO(data)) as im:
+        im.load()
+        size = placed_size(im.size, width, height, kind)
+        target = (max(1, round(size[0] * dpi / 72)), max(1, round(size[1] * dpi / 72)))
+        if im.size[0] > target[0] * RESAMPLE_MIN_RATIO or im.size[1] > target[1] * RESAMPLE_MIN_RATIO:
+            # Area averaging: no ringing around lines and text, and the result
+            # compresses better than with sharper filters
+            im = im.resize((min(target[0], im.size[0]), min(target[1], im.size[1])), Image.BOX)
+        fitted = _encode(im, image_format), size
+
+    with _fitted_lock:
+        _fitted[key] = fitted
+        while len(_fitted) > EMBED_CACHE_SIZE:
+            _fitted.popitem(last=False)
+    return fitted
+
+
+def embedded_image(source, width, height, dpi, kind='direct'):
+    """reportlab Image flowable for a raster source (path, bytes or file-like)
+       drawn at width x height points like Image(..., kind=kind), embedded at
+       dpi effective resolution. dpi None or 0 embeds the image as drawn.
+    """
+    from reportlab.platypus import Image
+
+    if not dpi:
+        return Image(source, width=width, height=height, kind=kind)
+    data, (draw_width, draw_height) = fit_image(read_image_source(source), width, height, dpi, kind)
+    return Image(io.BytesIO(data), width=draw_width, height=draw_height)
@@ -0,0 +1,82 @@
+import io
+
+from .profiling import PROFILE, build_doc
+from .styles import fonts
+
+
+def render_section_pdf(flowables, make_doc):
+    """Lays out one self-contained section (e.g. one question) on its own pages
+       and returns the PDF bytes. make_doc(output) must return a doc template
+       with the report's page size and margins.
+    """
+    buffer = io.BytesIO()
+    build_doc(make_doc(buffer), flowables)
+    return buffer.getvalue()
+
+
+def stitch_pdfs(parts, output, page_numbers=False):
+    """Concatenates section PDFs (bytes) into output, a path or binary
+       file-like object, in the given order. With page_numbers, every page of
+       the merged document is stamped "Page X of N". Returns the page count.
+    """
+    # Requires: pip install pypdf
+    from pypdf import PdfReader, PdfWriter
+
+    with PROFILE.phase('pdf merge'):
+        writer = PdfWriter()
+        for part in parts:
+            writer.append(PdfReader(io.BytesIO(part)))
+        if page_numbers:
+            number_pages(writer)
+        writer.write(output)
+    return len(writer.pages)
+
+
+def number_pages(writer, label="Page {page} of {total}"):
+    """Stamps a centred page number into the bottom margin of every page of a
+       pypdf PdfWriter, counting across all merged sections.
+    """
+    from pypdf import PdfReader
+    from reportlab.pdfgen import canvas
+
+    total = len(writer.pages)
+    buffer = io.BytesIO()
+    stamps = canvas.Canvas(buffer)
+    for number, page in enumerate(writer.pages, 1):
+        width, height = float(page.mediabox.width), float(page.mediabox.height)
+        stamps.setPageSize((width, height))
+        stamps.setFont(fonts()['normal'], 9)
+        stamps.drawCentredString(width / 2, 28, label.format(page=number, total=total))
+        stamps.showPage()
+    stamps.save()
+    for page, stamp in zip(writer.pages, PdfReader(buffer).pages):
+        page.merge_page(stamp)
+
+
+def build_sections(sections, make_doc, output, cache=None, prepare=None, page_numbers=False):
+    """Incremental build: sections is a list of (key, build) pairs, where key
+       fingerprints everything that affects the section's pages and build()
+       returns (flowables, cacheable). Sections found in the cache are reused
+       as already laid-out pages; only the others are built, stored and
+       stitched in. A section built with cacheable False (e.g. its chart could
+       not be drawn and a placeholder stands in for it) is not stored, so the
+       next build tries it again. prepare(indexes), if given, is called once
+       with the indexes of the sections about to be built (e.g. to render
+       their charts in one batch). page_numbers is passed on to stitch_pdfs.
+       Returns the number of sections that were rebuilt.
+    """
+    parts = [cache.get(key) if cache else None for key, _ in sections]
+    missing = [index for index, pdf in enumerate(parts) if pdf is None]
+    if missing and prepare is not None:
+        prepare(missing)
+    for index in missing:
+        key, build = sections[index]
+        flowables, cacheable = build()
+        parts[index] = render_section_pdf(flowables, make_doc)
+        if cache and cacheable:
+            try:
+                cache.put(key, parts[index])
+            except OSError as e:
+                print(f"Warning: Could not cache section pages: {e}")
+    stitch_pdfs(parts, output, page_numbers)
+    return len(missing)
@@ -0,0 +1,140 @@
+"""Paragraphs that reuse their markup parsing and line breaking.
+
+Exam solution books and survey reports repeat a lot of text ("Key Points to
+Expand Further:", section headings, table cells), and reportlab wraps each
+paragraph more than once while laying out a page. cached_paragraph(text,
+style) is a drop-in replacement for Paragraph(text, style) whose paragraphs
+remember, per process:
+
+- the parsed fragments, keyed on (text, style, bullet text), and
+- the line breaks and height, keyed on the above plus the available width.
+
+Both caches are bounded LRUs of PARAGRAPH_CACHE_SIZE entries each. Styles are
+keyed by identity, which is safe because the shared theme (styles.py) builds
+each style once and never changes it. Cached results are shared between
+paragraphs and never modified: before a paragraph is split across pages it
+is wrapped again without the cache, because splitting can edit the
+paragraph's fragments. Right-to-left, CJK and hyphenated styles, whose line
+breaking rewrites the lines, are never cached.
+"""
+from collections import OrderedDict
+from functools import lru_cache
+
+PARAGRAPH_CACHE_SIZE = 4096 # Entries per cache (parses, wraps); 0 turns caching off
+
+
+class _LRU:
+    """Small LRU mapping with hit and miss counts. Every process has its own
+       (report_server.py and the worker pools build in separate processes).
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > PARAGRAPH_CACHE_SIZE:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def info(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+
+_PARSED = _LRU() # (text, style, bulletText, caseSensitive) -> (text, frags, style, bulletText)
+_WRAPPED = _LRU() # parse key + (availWidth,) -> wrap() state, see CachedParagraph.wrap
+
+
+def _cacheable(style):
+    return not (style.wordWrap or getattr(style, 'hyphenationLang', '') or style.embeddedHyphenation
+                or style.uriWasteReduce)
+
+
+@lru_cache(maxsize=None)
+def _cached_paragraph_class():
+    # Built on first use so that importing report_common does not import reportlab
+    from reportlab.platypus import Paragraph
+
+    class CachedParagraph(Paragraph):
+        """Paragraph whose parse and wrap results are shared through the caches.
+
+        Paragraphs built from fragments (the halves of a split) and paragraphs
+        given per-instance settings such as autoLeading behave exactly like a
+        plain Paragraph.
+        """
+        _cache_key = None
+
+        def _setup(self, text, style, bulletText, frags, cleaner):
+            if frags is not None or not PARAGRAPH_CACHE_SIZE or not _cacheable(style):
+                return super()._setup(text, style, bulletText, frags, cleaner)
+            key = (text, style, bulletText, self.caseSensitive)
+            try:
+                parsed = _PARSED.get(key)
+            except TypeError: # Unhashable bulletText (a fragment list)
+                return super()._setup(text, style, bulletText, frags, cleaner)
+            if parsed is None:
+                super()._setup(text, style, bulletText, frags, cleaner)
+                parsed = (self.text, self.frags, self.style, self.bulletText)
+                _PARSED.put(key, parsed)
+            else:
+                self.text, self.frags, self.style, self.bulletText = parsed
+                self.debug = 0
+            self._cache_key = key
+            self._parsed_frags = parsed[1]
+
+        def wrap(self, availWidth, availHeight):
+            if self._cache_key is None or 'autoLeading' in self.__dict__:
+                return super().wrap(availWidth, availHeight)
+            key = self._cache_key + (availWidth,)
+            wrapped = _WRAPPED.get(key)
+            if wrapped is None:
+                self.frags = self._parsed_frags # Break the original fragments, as a fresh paragraph would
+                super().wrap(availWidth, availHeight)
+                wrapped = (self.width, self.height, self.blPara, self.frags, self._wrapWidths,
+                           getattr(self, '_width_max', 0))
+                _WRAPPED.put(key, wrapped)
+            else:
+                self.width, self.height, self.blPara, self.frags, self._wrapWidths, self._width_max = wrapped
+            return self.width, self.height
+
+        def split(self, availWidth, availHeight):
+            if self._cache_key is not None:
+                # Splitting can edit the fragments, so work on a private wrap
+                self._cache_key = None
+                self.frags = self._parsed_frags
+                super().wrap(availWidth, availHeight)
+            return super().split(availWidth, availHeight)
+
+    return CachedParagraph
+
+
+def cached_paragraph(text, style, bulletText=None):
+    """Paragraph(text, style, bulletText) that shares its layout work with
+       every other paragraph of the same text and style.
+    """
+    return _cached_paragraph_class()(text, style, bulletText)
+
+
+def paragraph_cache_info():
+    """Hit and miss counts of the parse and wrap caches in this process."""
+    return {'parse': _PARSED.info(), 'wrap': _WRAPPED.info()}
+
+
+def clear_paragraph_cache():
+    _PARSED.clear()
+    _WRAPPED.clear()
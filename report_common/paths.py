@@ -0,0 +1,19 @@
+"""Import paths of the generator scripts.
+
+chapter_5.py sits at the repository root, diagram.py in Diagram/ and
+Sample1.py in Pyq/. Tools that drive all of them (report_server.py, the
+benchmarks, the tests) call add_generator_paths() to import them by name.
+"""
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GENERATOR_DIRS = ('', 'Diagram', 'Pyq') # Relative to ROOT_DIR
+
+
+def add_generator_paths():
+    """Puts the repository root and the generator directories on sys.path."""
+    for subdir in GENERATOR_DIRS:
+        path = os.path.join(ROOT_DIR, subdir)
+        if path not in sys.path:
+            sys.path.insert(0, path)
@@ -0,0 +1,236 @@
+"""Build-time instrumentation for the report generators.
+
+PROFILE is a process-wide phase timer. It is off by default, and then each
+phase() costs one generator call. The generators wrap their hot paths in it:
+
+    with PROFILE.phase('chart render', question=q_num):
+        ...
+
+build_doc() runs doc.build() as the 'layout' phase, streaming generator
+stories (see streaming.py). Its canvas also times each finished page ('page')
+and the final file write ('pdf write'). Phases can nest; every record keeps
+its depth. Work done in worker processes is collected with
+run_profiled() and merged back with PROFILE.merge() (workers.py does both).
+
+The --profile flag of chapter_5.py, diagram.py and Sample1.py prints report()
+at the end of the build, and --profile-json PATH writes trace() as JSON.
+"""
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+
+def peak_rss_mb():
+    """Peak resident set size in MB of this process and of its finished children
+       (worker pools), or None where the resource module is unavailable.
+    """
+    try:
+        import resource
+    except ImportError: # Windows
+        return None
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return {
+        'self': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale, 1),
+        'children': round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale, 1),
+    }
+
+
+class BuildProfile:
+    """Collects (phase, seconds, labels) records for one build."""
+
+    def __init__(self):
+        self.enabled = False
+        self.reset()
+
+    def reset(self, enabled=None):
+        if enabled is not None:
+            self.enabled = enabled
+        self.records = []
+        self._depth = 0
+        self._origin = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name, **labels):
+        """Times the enclosed block as one record of phase name. Extra keyword
+           labels (e.g. question=5) are kept for per-question breakdowns.
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.add(name, start, **labels)
+
+    def add(self, name, started, **labels):
+        """Adds a record for a block that began at perf_counter() value started
+           and ends now.
+        """
+        if self.enabled:
+            record = {'phase': name, 'start': round(started - self._origin, 6),
+                      'seconds': round(time.perf_counter() - started, 6), 'depth': self._depth}
+            record.update(labels)
+            self.records.append(record)
+
+    def merge(self, records):
+        """Adds records returned by run_profiled() in a worker process."""
+        for record in records:
+            # perf_counter() is a system-wide monotonic clock, so worker times line up
+            self.records.append(dict(record, start=round(record['start'] - self._origin, 6)))
+
+    def totals(self):
+        """Returns {phase: {'count': n, 'seconds': s}} in order of first use."""
+        totals = {}
+        for record in sorted(self.records, key=lambda record: record['start']):
+            total = totals.setdefault(record['phase'], {'count': 0, 'seconds': 0.0})
+            total['count'] += 1
+            total['seconds'] += record['seconds']
+        for total in totals.values():
+            total['seconds'] = round(total['seconds'], 6)
+        return totals
+
+    def by_label(self, label):
+        """Returns {label value: {phase: seconds}}, e.g. by_label('question')."""
+        breakdown = {}
+        for record in self.records:
+            if label in record:
+                phases = breakdown.setdefault(str(record[label]), {})
+                phases[record['phase']] = round(phases.get(record['phase'], 0.0) + record['seconds'], 6)
+        return breakdown
+
+    def label_totals(self, label):
+        """Returns {label value: seconds}, counting only each value's outermost
+           records so nested phases are not added twice.
+        """
+        outermost = {}
+        for record in self.records:
+            if label in record:
+                key = str(record[label])
+                outermost[key] = min(outermost.get(key, record['depth']), record['depth'])
+        totals = dict.fromkeys(outermost, 0.0)
+        for record in self.records:
+            if label in record and record['depth'] == outermost[str(record[label])]:
+                totals[str(record[label])] += record['seconds']
+        return totals
+
+    def trace(self, **info):
+        """Machine-readable trace: totals, per-question breakdown, peak RSS and
+           every record. info (e.g. generator='survey') is included as is.
+        """
+        return dict(info,
+                    wall_seconds=round(time.perf_counter() - self._origin, 6),
+                    peak_rss_mb=peak_rss_mb(),
+                    phases=self.totals(),
+                    questions=self.by_label('question'),
+                    records=self.records)
+
+    def write_json(self, path, **info):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.trace(**info), f, indent=2)
+
+    def report(self):
+        """Human-readable summary: time per phase (nested phases indented, their
+           time is part of the phase above), slowest questions and peak RSS.
+        """
+        wall = time.perf_counter() - self._origin
+        depths = {}
+        for record in self.records:
+            depths[record['phase']] = min(depths.get(record['phase'], record['depth']), record['depth'])
+        lines = [f"--- Build profile ({wall:.2f}s wall) ---",
+                 f"{'phase':<24}{'count':>7}{'total s':>10}{'mean ms':>10}"]
+        for name, total in self.totals().items():
+            label = '  ' * depths[name] + name
+            lines.append(f"{label:<24}{total['count']:>7}{total['seconds']:>10.3f}"
+                         f"{total['seconds'] / total['count'] * 1000:>10.1f}")
+        questions = self.label_totals('question')
+        if questions:
+            slowest = sorted(questions.items(), key=lambda item: -item[1])[:5]
+            lines.append("Slowest questions: " + ", ".join(f"Q{key} {seconds:.3f}s" for key, seconds in slowest))
+        rss = peak_rss_mb()
+        if rss:
+            lines.append(f"Peak RSS: {rss['self']} MB (finished child processes {rss['children']} MB)")
+        return "\n".join(lines)
+
+
+PROFILE = BuildProfile()
+
+
+def run_profiled(function, job):
+    """Worker-side wrapper (use with functools.partial): runs function(job)
+       with profiling on and returns (result, records) for the parent to pass
+       to PROFILE.merge().
+    """
+    PROFILE.reset(enabled=True)
+    result = function(job)
+    records = [dict(record, start=record['start'] + PROFILE._origin, worker=os.getpid())
+               for record in PROFILE.records]
+    PROFILE.reset(enabled=False)
+    return result, records
+
+
+def _profiled_canvas_class():
+    from .streaming import streaming_canvas_class
+
+    class ProfiledCanvas(streaming_canvas_class()):
+        """Times every finished page and the final PDF write."""
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._page_started = time.perf_counter()
+
+        def showPage(self):
+            PROFILE.add('page', self._page_started, page=self.getPageNumber())
+            super().showPage()
+            self._page_started = time.perf_counter()
+
+        def save(self):
+            with PROFILE.phase('pdf write'):
+                super().save()
+
+    return ProfiledCanvas
+
+
+def build_doc(doc, story):
+    """doc.build(story), timed as 'layout' when profiling is on. A story that
+       is not a list (e.g. a generator) is streamed through a FlowableStream.
+    """
+    from .streaming import FlowableStream, streaming_canvas_class
+
+    if not isinstance(story, list):
+        story = FlowableStream(story)
+    if not PROFILE.enabled:
+        doc.build(story, canvasmaker=streaming_canvas_class())
+        return
+    with PROFILE.phase('layout'):
+        doc.build(story, canvasmaker=_profiled_canvas_class())
+
+
+def add_profile_arguments(parser):
+    """Adds --profile and --profile-json to a generator's argparse parser."""
+    parser.add_argument('--profile', action='store_true', help="print where the build time went")
+    parser.add_argument('--profile-json', metavar='PATH', help="write a machine-readable timing trace")
+
+
+def start_profile(args):
+    if args.profile or args.profile_json:
+        PROFILE.reset(enabled=True)
+
+
+def finish_profile(args, **info):
+    """Prints and/or writes the profile requested on the command line."""
+    if not PROFILE.enabled:
+        return
+    if args.profile:
+        print(PROFILE.report())
+    if args.profile_json:
+        try:
+            PROFILE.write_json(args.profile_json, **info)
+            print(f"Profile trace written to: {args.profile_json}")
+        except OSError as e:
+            print(f"Error writing profile trace {args.profile_json}: {e}")
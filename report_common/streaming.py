@@ -0,0 +1,107 @@
+"""Streaming stories: lay out flowables as a generator produces them.
+
+reportlab's doc.build() takes a list and consumes it from the front, so a
+whole report's flowables (paragraphs, tables, images and the image data they
+hold) normally exist at the same time. FlowableStream gives doc.build() the
+few list operations it uses, but only pulls flowables from the generator
+when the layout reaches them, and drops each one once it has been drawn. A
+report built from a generator therefore holds roughly a page of flowables at
+a time, however long it is.
+
+What stays in memory is the finished pages, which the canvas keeps until it
+writes the file. reportlab holds each page's drawing commands as text and only
+compresses them in save(); the canvas of build_doc() (streaming_canvas_class)
+compresses each page as soon as it is finished, with the same filters, so a
+long report keeps roughly its final file size in memory rather than several
+times that. The PDF is unchanged.
+
+build_doc() streams any story that is not a list, so generators can be passed
+straight to it (and to render_section_pdf()).
+"""
+from functools import lru_cache
+
+
+class FlowableStream:
+    """List-like view of an iterable of flowables for doc.build().
+
+    Only a short lookahead is buffered: the next flowable plus, when it has
+    keepWithNext set, the rest of its keep-with-next chain, so keepWithNext
+    and KeepTogether work as with a list. len() is the length of the buffer,
+    which is 0 only when the story is finished. multiBuild() needs the whole
+    story and is not supported.
+    """
+
+    def __init__(self, flowables):
+        self._source = iter(flowables)
+        self._buffer = []
+        self.pulled = 0 # Flowables taken from the source so far
+
+    def _pull(self):
+        for flowable in self._source:
+            self._buffer.append(flowable)
+            self.pulled += 1
+            return True
+        return False
+
+    def _lookahead(self):
+        if not self._buffer and not self._pull():
+            return
+        # handle_keepWithNext() groups a chain with the flowable that ends it
+        while getattr(self._buffer[-1], 'getKeepWithNext', lambda: False)() and self._pull():
+            pass
+
+    def __len__(self):
+        self._lookahead()
+        return len(self._buffer)
+
+    def __getitem__(self, index):
+        self._lookahead()
+        if isinstance(index, int):
+            while index >= len(self._buffer) and self._pull():
+                pass
+        return self._buffer[index]
+
+    def __setitem__(self, index, value):
+        self._buffer[index] = value
+
+    def __delitem__(self, index):
+        self._lookahead()
+        del self._buffer[index]
+
+    def insert(self, index, flowable):
+        self._buffer.insert(index, flowable)
+
+
+def compact_page(page):
+    """Encodes a finished reportlab PDFPage's content stream now instead of in
+       save(), so only the compressed bytes are kept. Pages without compression
+       or with a stream already set are left alone.
+    """
+    from reportlab import rl_config
+    from reportlab.pdfbase import pdfdoc
+
+    if page.Contents or not page.stream or not page.compression:
+        return
+    filters = [pdfdoc.PDFBase85Encode, pdfdoc.PDFZCompress] if rl_config.useA85 else [pdfdoc.PDFZCompress]
+    content = page.stream
+    for stream_filter in reversed(filters):
+        content = stream_filter.encode(content)
+    stream = pdfdoc.PDFStream(content=content)
+    # A Filter entry tells PDFStream.format() the content is already encoded
+    stream.dictionary['Filter'] = pdfdoc.PDFArray([pdfdoc.PDFName(f.pdfname) for f in filters])
+    stream.__Comment__ = "page stream"
+    page.Contents = stream
+    page.stream = None
+
+
+@lru_cache(maxsize=None)
+def streaming_canvas_class():
+    """Canvas class that compacts every page when it is finished."""
+    from reportlab.pdfgen.canvas import Canvas
+
+    class StreamingCanvas(Canvas):
+        def showPage(self):
+            super().showPage()
+            compact_page(self._doc.Pages[-1])
+
+    return StreamingCanvas
@@ -0,0 +1,171 @@
+"""Shared report theme: fonts, paragraph styles and table styles.
+
+Every style set is built once per process, on first use, and then shared by
+all builds in that process, so repeated builds (report_server.py, batch mode)
+skip the set-up. The sets are read-only mappings. Derive a variant with
+ParagraphStyle('Name', parent=style, ...) instead of editing a shared style.
+
+All styles take their fonts from fonts(), so switching the theme to a
+TrueType family changes every report at once.
+"""
+from functools import lru_cache
+from types import MappingProxyType
+
+# Optional TrueType family used instead of the built-in Helvetica fonts, e.g.
+# for text Helvetica cannot show: {'normal': '/path/DejaVuSans.ttf', 'bold': ...,
+# 'italic': ..., 'bold_italic': ...} (missing faces fall back to 'normal').
+# TrueType fonts are embedded as subsets holding only the glyphs in use.
+TTF_FAMILY = None
+TTF_FAMILY_NAME = 'ReportSans'
+
+BUILTIN_FONTS = {
+    'normal': 'Helvetica',
+    'bold': 'Helvetica-Bold',
+    'italic': 'Helvetica-Oblique',
+    'bold_italic': 'Helvetica-BoldOblique',
+}
+
+
+@lru_cache(maxsize=None)
+def fonts():
+    """Registers the theme fonts once per process and returns their names by
+       face ('normal', 'bold', 'italic', 'bold_italic'). Their metrics are
+       loaded here too, so the first layout does not pay for it.
+    """
+    from reportlab.pdfbase import pdfmetrics
+
+    names = dict(BUILTIN_FONTS)
+    if TTF_FAMILY:
+        from reportlab.lib.fonts import addMapping
+        from reportlab.pdfbase.ttfonts import TTFont
+        suffixes = {'normal': '', 'bold': '-Bold', 'italic': '-Italic', 'bold_italic': '-BoldItalic'}
+        for face, suffix in suffixes.items():
+            names[face] = TTF_FAMILY_NAME + suffix
+            pdfmetrics.registerFont(TTFont(names[face], TTF_FAMILY.get(face) or TTF_FAMILY['normal']))
+        # Let <b> and <i> markup pick the matching faces
+        for (bold, italic), face in {(0, 0): 'normal', (1, 0): 'bold', (0, 1): 'italic', (1, 1): 'bold_italic'}.items():
+            addMapping(TTF_FAMILY_NAME, bold, italic, names[face])
+    for name in names.values():
+        pdfmetrics.getFont(name)
+    return MappingProxyType(names)
+
+
+def theme_key():
+    """Everything about the theme fonts that changes laid-out pages, for page
+       cache keys: the resolved font names and the TrueType files behind them.
+    """
+    return tuple(fonts().items()), tuple(sorted(TTF_FAMILY.items())) if TTF_FAMILY else None
+
+
+@lru_cache(maxsize=None)
+def sample_styles():
+    """reportlab's sample stylesheet, the parent of the theme's styles."""
+    from reportlab.lib.styles import getSampleStyleSheet
+    return getSampleStyleSheet()
+
+
+def _style(name, parent, **kw):
+    from reportlab.lib.styles import ParagraphStyle
+    return ParagraphStyle(name, parent=sample_styles()[parent] if isinstance(parent, str) else parent, **kw)
+
+
+@lru_cache(maxsize=None)
+def survey_styles():
+    """Styles of the survey analysis report (chapter_5.py)."""
+    from reportlab.platypus import TableStyle
+    from reportlab.lib.enums import TA_LEFT, TA_CENTER
+    from reportlab.lib import colors
+
+    font = fonts()
+    title = _style('SurveyTitle', 'h2', alignment=TA_LEFT, fontName=font['bold'], fontSize=12, spaceAfter=6)
+    body = _style('SurveyBody', 'BodyText', alignment=TA_LEFT, fontName=font['normal'], fontSize=10, leading=14,
+                  spaceAfter=6)
+
+    # Table Styling - Reverted to the "professional" grey/beige style
+    table = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),           # Header background
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),      # Header text
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), font['bold']),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),       # Body background
+        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),         # Body text
+        ('FONTNAME', (0, 1), (-1, -1), font['normal']),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ('ALIGN', (0, 1), (-1, -1), 'CENTER'),                 # Center align text in cells
+        ('TOPPADDING', (0, 1), (-1, -1), 4),
+        ('BOTTOMPADDING', (0, 1), (-1, -1), 4),
+
+        # Grid lines
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        # Style for TOTAL row (last row index is -1)
+        ('FONTNAME', (0, -1), (-1, -1), font['bold']),
+        ('BACKGROUND', (0, -1), (-1, -1), colors.lightgrey),   # Different background for Total row
+    ])
+
+    # Wrapping header cells for cross-tab tables (matches the table header row)
+    table_header = _style('SurveyTableHeader', body, fontName=font['bold'], fontSize=8, leading=10,
+                          alignment=TA_CENTER, textColor=colors.whitesmoke, spaceAfter=0)
+    return MappingProxyType({'title': title, 'body': body, 'table_header': table_header, 'table': table})
+
+
+@lru_cache(maxsize=None)
+def diagram_styles():
+    """Styles of the diagram solutions (diagram.py)."""
+    from reportlab.platypus import TableStyle
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib import colors
+
+    font = fonts()
+    return MappingProxyType({
+        'title': _style('DiagramTitle', 'h1', fontName=font['bold'], fontSize=18, spaceAfter=14,
+                        textColor=colors.HexColor('#2C3E50')),
+        'question': _style('DiagramQuestion', 'h2', fontName=font['bold'], fontSize=12, spaceAfter=10, leading=14,
+                           textColor=colors.HexColor('#34495E')),
+        'body': _style('DiagramBody', 'BodyText', fontName=font['normal']),
+        'table_title': _style('DiagramTableTitle', 'h3', fontName=font['bold'], fontSize=14, leading=18,
+                              alignment=TA_CENTER, spaceAfter=12),
+        'table_header': _style('DiagramTableHeader', 'BodyText', fontName=font['bold'], textColor=colors.white),
+        'table_cell': _style('DiagramTableCell', 'BodyText', fontName=font['normal']),
+        'table': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#40466e')),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0f1f6')]),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            ('LINEBELOW', (0, 0), (-1, -1), 0.5, colors.HexColor('#d0d3e2')),
+        ]),
+    })
+
+
+@lru_cache(maxsize=None)
+def exam_styles():
+    """Styles of the exam solutions (Sample1.py)."""
+    from reportlab.lib.enums import TA_JUSTIFY, TA_CENTER
+    from reportlab.lib.units import cm
+    from reportlab.lib.colors import HexColor
+
+    font = fonts()
+    body = _style('BodyStyle', 'Normal', fontName=font['normal'], fontSize=12,
+                  leading=16, # Line spacing
+                  alignment=TA_JUSTIFY, spaceAfter=0.2*cm)
+    return MappingProxyType({
+        'title': _style('TitleStyle', 'h1', fontName=font['bold'], fontSize=18, spaceAfter=0.5*cm, alignment=TA_CENTER,
+                        textColor=HexColor('#000080')), # Dark Blue
+        'question': _style('QuestionStyle', 'h2', fontName=font['bold'], fontSize=14, spaceBefore=0.8*cm,
+                           spaceAfter=0.3*cm, textColor=HexColor('#4682B4')), # Steel Blue
+        'body': body,
+        'point': _style('BoldPointStyle', body, fontName=font['bold'], fontSize=12, leading=16, leftIndent=0.5*cm,
+                        bulletIndent=0*cm, spaceBefore=0.1*cm, spaceAfter=0.1*cm),
+        'sub_heading': _style('SubHeadingStyle', 'h3', fontSize=13, fontName=font['bold'], spaceBefore=0.3*cm,
+                              spaceAfter=0.2*cm, textColor=HexColor('#2F4F4F')), # Dark Slate Gray
+        'memory_trick': _style('MemoryTrickStyle', body, textColor=HexColor('#800080'), # Purple
+                               fontName=font['italic'], leftIndent=0.5*cm, spaceBefore=0.2*cm, spaceAfter=0.3*cm),
+        'diagram_suggestion': _style('DiagramSuggestionStyle', body, textColor=HexColor('#006400'), # Dark Green
+                                     leftIndent=0.5*cm, spaceBefore=0.2*cm, spaceAfter=0.3*cm),
+        'expand_points': _style('ExpandPointsStyle', body, fontName=font['bold_italic'],
+                                textColor=HexColor('#A0522D'), # Sienna
+                                spaceBefore=0.3*cm, spaceAfter=0.4*cm),
+    })
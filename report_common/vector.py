@@ -0,0 +1,28 @@
+import io
+
+
+def svg_flowable(source, width, height, keep_aspect=False):
+    """Converts an SVG (path, bytes or binary file-like) into a reportlab Drawing.
+
+    The drawing is scaled to width x height points, or to fit inside that box
+    when keep_aspect is True (like Image(kind='proportional')). The result is
+    native PDF vector graphics, so nothing is rasterised or embedded as a bitmap.
+    """
+    # Requires: pip install svglib
+    from svglib.svglib import svg2rlg
+
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    drawing = svg2rlg(source)
+    if drawing is None:
+        raise ValueError("could not parse SVG chart")
+
+    scale_x = width / drawing.width
+    scale_y = height / drawing.height
+    if keep_aspect:
+        scale_x = scale_y = min(scale_x, scale_y)
+    drawing.scale(scale_x, scale_y)
+    drawing.width *= scale_x
+    drawing.height *= scale_y
+    drawing.hAlign = 'CENTER'
+    return drawing
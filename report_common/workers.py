@@ -0,0 +1,79 @@
+"""Process pools for the generators' parallel work: charts, diagrams, report
+sections and batch papers.
+
+Jobs run serially when no worker processes can be started. When profiling is
+on, the workers' timings are merged into this process's PROFILE.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+
+from .profiling import PROFILE, run_profiled
+
+
+class WorkerPool:
+    """Process pool whose map() falls back to running the jobs serially.
+
+    The processes are started on first use and kept for later map() calls, so
+    a long-running process only pays their start-up cost once (a different
+    worker count restarts them). initializer(*initargs) runs in every worker,
+    and in this process before jobs are run serially.
+    """
+
+    def __init__(self, initializer=None, initargs=()):
+        self.initializer = initializer
+        self.initargs = initargs
+        self._executor = None
+        self._workers = 0
+
+    def _get_executor(self, workers):
+        if self._executor is None or self._workers != workers:
+            self.shutdown()
+            self._executor = ProcessPoolExecutor(max_workers=workers, initializer=self.initializer,
+                                                 initargs=self.initargs)
+            self._workers = workers
+        return self._executor
+
+    def _map_serially(self, function, jobs):
+        if self.initializer is not None:
+            self.initializer(*self.initargs)
+        return [function(job) for job in jobs]
+
+    def map(self, function, jobs, workers):
+        """Runs function over jobs in up to workers processes, results in job
+           order. Runs serially for a single worker or job, or if no pool can
+           be started.
+        """
+        if workers <= 1 or len(jobs) <= 1:
+            return self._map_serially(function, jobs)
+        try:
+            executor = self._get_executor(workers)
+            if not PROFILE.enabled:
+                return list(executor.map(function, jobs))
+            # Bring the workers' timings back into this process's trace
+            results = []
+            for result, records in executor.map(partial(run_profiled, function), jobs):
+                results.append(result)
+                PROFILE.merge(records)
+            return results
+        except (OSError, ImportError, NotImplementedError, BrokenProcessPool) as e:
+            # e.g. Android builds without working multiprocessing semaphores
+            print(f"Warning: Could not use worker pool ({e}). Running serially.")
+            self.shutdown()
+            return self._map_serially(function, jobs)
+
+    def shutdown(self):
+        """Stops the worker processes, if any are running."""
+        if self._executor is not None:
+            self._executor.shutdown()
+        self._executor = None
+        self._workers = 0
+
+
+def map_in_workers(function, jobs, workers, initializer=None, initargs=()):
+    """WorkerPool.map() with a pool that only lives for this call."""
+    pool = WorkerPool(initializer, initargs)
+    try:
+        return pool.map(function, jobs, min(workers, len(jobs)))
+    finally:
+        pool.shutdown()
@@ -0,0 +1,254 @@
+"""Long-lived report worker for the survey, diagram and exam-solution generators.
+
+Each report built with a fresh `python chapter_5.py` pays for interpreter
+start-up, the matplotlib import, the font cache and the reportlab styles. This
+server pays for them once: it keeps a pool of warm worker processes and feeds
+them report jobs from a queue.
+
+Jobs are JSON objects, one per line, read from stdin (default) or from clients
+of a Unix socket (--socket PATH):
+
+    {"id": "r1", "generator": "survey", "output": "/tmp/survey.pdf", "options": {"chart_backend": "reportlab"}}
+    {"id": "r2", "generator": "diagram", "output": "/tmp/diagrams.pdf"}
+    {"id": "r3", "generator": "exam", "output": "/tmp/exam.pdf"}
+
+Survey jobs may also carry their own "survey_data" list. For every job one JSON
+line is written back when it finishes, in completion order:
+
+    {"id": "r1", "status": "ok", "output": "/tmp/survey.pdf", "queued_s": 0.0, "build_s": 1.52, "latency_s": 1.52}
+
+Generator progress output goes to stderr so stdout only carries responses.
+"""
+import argparse
+import json
+import os
+import signal
+import socketserver
+import statistics
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from report_common import add_generator_paths
+
+add_generator_paths()
+
+
+# --- Generators (run inside the worker processes) ---
+
+def _build_survey(job):
+    import chapter_5
+    # Concurrency comes from the job queue, so each job renders its charts serially,
+    # and concurrent jobs would share CHART_DIR, so charts always stay in memory
+    options = dict({'chart_workers': 1}, **job.get('options', {}))
+    options['in_memory_charts'] = True
+    return chapter_5.build_survey_report(job.get('survey_data', chapter_5.survey_data), job['output'], options)
+
+def _build_diagram(job):
+    import diagram
+    # Concurrent jobs would share IMG_DIR, so diagrams always stay in memory here,
+    # and they are drawn serially like the survey charts
+    return diagram.build_diagram_report(job['output'], in_memory_images=True, diagram_workers=1)
+
+def _build_exam(job):
+    import Sample1
+    output = Sample1.generate_exam_solutions_pdf(job['output'])
+    if output is None:
+        raise RuntimeError("exam solutions PDF could not be written")
+    return output
+
+GENERATORS = {
+    'survey': _build_survey,
+    'diagram': _build_diagram,
+    'exam': _build_exam,
+}
+
+def _warm_up():
+    """Worker initializer: pays the import and style set-up cost once per process."""
+    sys.stdout = sys.stderr # Keep generator progress output off the response stream
+    import chapter_5
+    import diagram
+    import Sample1
+    import matplotlib.figure
+    chapter_5.get_report_styles()
+
+def run_job(job):
+    """Runs one job in a worker process and returns its build time in seconds."""
+    started = time.perf_counter()
+    GENERATORS[job['generator']](job)
+    return time.perf_counter() - started
+
+
+# --- Job queue ---
+
+class ReportServer:
+    """Queues report jobs onto a pool of warm worker processes."""
+
+    def __init__(self, concurrency=1):
+        self.concurrency = concurrency
+        self.executor = self._start_workers()
+        self.latencies = []
+        self.failures = 0
+        self._lock = threading.Lock()
+        self._pool_lock = threading.Lock()
+        self._closed = False
+
+    def _start_workers(self):
+        return ProcessPoolExecutor(max_workers=self.concurrency, initializer=_warm_up)
+
+    def _submit(self, job):
+        """Queues a job on the worker pool. A pool broken by a dead worker
+           (e.g. one killed for running out of memory) is replaced by a fresh,
+           warmed-up one first; the jobs it was running have already failed.
+        """
+        with self._pool_lock:
+            executor = self.executor
+        try:
+            return executor.submit(run_job, job)
+        except (BrokenProcessPool, RuntimeError):
+            with self._pool_lock:
+                if self._closed:
+                    raise
+                if self.executor is executor:
+                    print("Warning: A worker process died; restarting the worker pool.", file=sys.stderr)
+                    executor.shutdown(wait=False)
+                    self.executor = self._start_workers()
+                executor = self.executor
+            return executor.submit(run_job, job)
+
+    def submit(self, line, respond):
+        """Parses one request line and queues it. respond(dict) is called once,
+           from another thread, when the job has finished or been rejected.
+        """
+        try:
+            job = json.loads(line)
+            if not isinstance(job, dict):
+                raise ValueError("a job must be a JSON object")
+            if job.get('generator') not in GENERATORS:
+                raise ValueError(f"unknown generator {job.get('generator')!r}, expected one of {sorted(GENERATORS)}")
+            if not job.get('output'):
+                raise ValueError("job has no 'output' path")
+        except ValueError as e:
+            respond({'id': None, 'status': 'error', 'error': f"bad request: {e}"})
+            return None
+
+        submitted = time.perf_counter()
+        try:
+            future = self._submit(job)
+        except (BrokenProcessPool, RuntimeError) as e:
+            latency = time.perf_counter() - submitted
+            with self._lock:
+                self.latencies.append(latency)
+                self.failures += 1
+            respond({'id': job.get('id'), 'generator': job['generator'], 'output': job['output'], 'status': 'error',
+                     'error': f"could not queue job: {type(e).__name__}: {e}", 'latency_s': round(latency, 3)})
+            return None
+
+        def done(future):
+            latency = time.perf_counter() - submitted
+            response = {'id': job.get('id'), 'generator': job['generator'], 'output': job['output']}
+            try:
+                build_time = future.result()
+                response.update(status='ok', queued_s=round(max(latency - build_time, 0.0), 3),
+                                build_s=round(build_time, 3))
+            except Exception as e:
+                response.update(status='error', error=f"{type(e).__name__}: {e}")
+            response['latency_s'] = round(latency, 3)
+            with self._lock:
+                self.latencies.append(latency)
+                if response['status'] != 'ok':
+                    self.failures += 1
+            respond(response)
+
+        future.add_done_callback(done)
+        return future
+
+    def serve_stream(self, rfile, wfile):
+        """Reads JSON job lines from rfile until EOF, writing responses to wfile.
+           Returns once every job read from the stream has finished.
+        """
+        finished = threading.Condition()
+        pending = 0
+
+        def respond(response):
+            nonlocal pending
+            with finished:
+                wfile.write(json.dumps(response) + "\n")
+                wfile.flush()
+                pending -= 1
+                finished.notify_all()
+
+        for line in rfile:
+            if line.strip():
+                with finished:
+                    pending += 1
+                self.submit(line, respond)
+        with finished:
+            finished.wait_for(lambda: pending == 0)
+
+    def summary(self):
+        if not self.latencies:
+            return "No jobs processed."
+        latencies = sorted(self.latencies)
+        p95 = latencies[min(len(latencies) - 1, int(round(0.95 * (len(latencies) - 1))))]
+        return (f"{len(latencies)} jobs ({self.failures} failed), latency mean "
+                f"{statistics.mean(latencies):.2f}s, median {statistics.median(latencies):.2f}s, "
+                f"p95 {p95:.2f}s, concurrency {self.concurrency}")
+
+    def shutdown(self):
+        with self._pool_lock:
+            self._closed = True
+            executor = self.executor
+        executor.shutdown()
+
+
+def serve_unix_socket(server, path):
+    """Accepts any number of clients on a Unix socket; each sends job lines and
+       receives the responses for its own jobs.
+    """
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            rfile = self.request.makefile('r', encoding='utf-8')
+            wfile = self.request.makefile('w', encoding='utf-8')
+            server.serve_stream(rfile, wfile)
+
+    if os.path.exists(path):
+        os.remove(path)
+    with socketserver.ThreadingUnixStreamServer(path, Handler) as unix_server:
+        print(f"Report server listening on {path} (concurrency {server.concurrency})", file=sys.stderr)
+        # shutdown() blocks until serve_forever() returns, so call it off the main thread
+        signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=unix_server.shutdown).start())
+        try:
+            unix_server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.remove(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve report jobs from warm worker processes.")
+    parser.add_argument('--concurrency', type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument('--socket', help="listen on this Unix socket instead of stdin/stdout")
+    args = parser.parse_args(argv)
+
+    server = ReportServer(max(1, args.concurrency))
+    try:
+        if args.socket:
+            serve_unix_socket(server, args.socket)
+        else:
+            server.serve_stream(sys.stdin, sys.stdout)
+    except Exception:
+        traceback.print_exc()
+        return 1
+    finally:
+        server.shutdown()
+        print(server.summary(), file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,118 @@
+"""Columnar NumPy aggregation for the survey report.
+
+summarize_survey() turns the per-question data dicts into counts, percentages
+and totals for every question at once, using one flat array and bincount over
+question ids instead of per-category Python loops. chapter_5.py builds both the
+table rows and the chart inputs from that single result.
+
+ColumnarTally does the counting for raw responses (see survey_ingest.py):
+answers are encoded to integer option codes in NumPy arrays one chunk at a time
+and counted with bincount (single choice) or an indicator-matrix column sum
+(multi-select).
+"""
+import numpy as np
+
+
+def summarize_survey(questions, default_total_respondents):
+    """Computes counts, percentages and totals for all questions with data.
+
+    Returns {question_num: summary}, where each summary dict holds 'labels',
+    'counts', 'percentages' (lists in option order), 'total_count',
+    'total_respondents' and 'chart_type'. Percentages use the same base as the
+    report: the question's total count for pie charts and the number of
+    respondents for bar (multi-select) charts.
+    """
+    items = [item for item in questions if item.get('data')]
+    if not items:
+        return {}
+    lengths = np.array([len(item['data']) for item in items], dtype=np.intp)
+    counts = np.array([count for item in items for count in item['data'].values()])
+    question_ids = np.repeat(np.arange(len(items)), lengths)
+
+    total_counts = np.bincount(question_ids, weights=counts, minlength=len(items)).astype(counts.dtype)
+    respondents = np.array([item.get('total_respondents', default_total_respondents) for item in items])
+    is_pie = np.array([item.get('chart_type') == 'pie' for item in items])
+    basis = np.where(is_pie, total_counts, respondents).astype(np.float64)
+    basis[basis == 0] = 1 # Avoid division by zero
+    percentages = counts / basis[question_ids] * 100
+
+    offsets = np.cumsum(lengths)[:-1]
+    summaries = {}
+    for item, item_counts, item_percentages, total_count, total_respondents in zip(
+            items, np.split(counts, offsets), np.split(percentages, offsets),
+            total_counts.tolist(), respondents.tolist()):
+        summaries[item['question_num']] = {
+            'labels': list(item['data'].keys()),
+            'counts': item_counts.tolist(),
+            'percentages': item_percentages.tolist(),
+            'total_count': total_count,
+            'total_respondents': total_respondents,
+            'chart_type': item.get('chart_type'),
+        }
+    return summaries
+
+
+class ColumnarTally:
+    """Counts raw answers per question and option, one chunk at a time.
+
+    Every question keeps a vocabulary (option label -> integer code) seeded from
+    its data dict, so known options keep their order; unseen options get new
+    codes as they appear. Memory use is bounded by the chunk size.
+    """
+
+    def __init__(self, questions):
+        self.vocab = {}
+        self.counts = {}
+        self.answered = {}
+        self.multi_select = set()
+        for item in questions:
+            if not item.get('data'):
+                continue
+            q_num = item['question_num']
+            self.vocab[q_num] = {label: code for code, label in enumerate(item['data'])}
+            self.counts[q_num] = np.zeros(len(item['data']), dtype=np.int64)
+            self.answered[q_num] = 0
+            if item.get('multi_select'):
+                self.multi_select.add(q_num)
+
+    def _encode(self, q_num, label):
+        vocab = self.vocab[q_num]
+        code = vocab.get(label)
+        if code is None:
+            code = vocab[label] = len(vocab)
+        return code
+
+    def _add_counts(self, q_num, chunk_counts):
+        counts = self.counts[q_num]
+        if len(chunk_counts) > len(counts):
+            counts = self.counts[q_num] = np.pad(counts, (0, len(chunk_counts) - len(counts)))
+        counts[:len(chunk_counts)] += chunk_counts
+
+    def add_chunk(self, q_num, answers):
+        """Adds one chunk of answers for a question. answers holds one list of
+           selected labels per respondent (empty if unanswered).
+        """
+        if q_num in self.multi_select:
+            rows = np.fromiter((row for row, selected in enumerate(answers) for _ in selected), dtype=np.intp)
+            codes = np.fromiter((self._encode(q_num, label) for selected in answers for label in selected), dtype=np.intp)
+            selected = np.zeros((len(answers), len(self.vocab[q_num])), dtype=bool)
+            selected[rows, codes] = True # Repeated picks of one option count once
+            self._add_counts(q_num, selected.sum(axis=0))
+            self.answered[q_num] += int(selected.any(axis=1).sum())
+        else:
+            codes = np.fromiter((self._encode(q_num, selected[0]) if selected else -1 for selected in answers),
+                                dtype=np.intp, count=len(answers))
+            codes = codes[codes >= 0]
+            self._add_counts(q_num, np.bincount(codes, minlength=len(self.vocab[q_num])))
+            self.answered[q_num] += len(codes)
+
+    def result(self):
+        """Returns {question_num: {'counts': {option: n}, 'answered': n}}."""
+        tallies = {}
+        for q_num, vocab in self.vocab.items():
+            counts = self.counts[q_num].tolist()
+            tallies[q_num] = {
+                'counts': {label: counts[code] for label, code in vocab.items() if code < len(counts)},
+                'answered': self.answered[q_num],
+            }
+        return tallies
@@ -0,0 +1,147 @@
+"""Cross-tabulation of survey questions over raw respondent records.
+
+A cross-tab counts, for two questions, how many respondents gave each pair of
+answers, e.g. Q1 Age by Q11 renewal likelihood. Counts are accumulated in a
+NumPy matrix (row option x column option) one chunk of respondents at a time,
+so any number of cross-tabs are filled in the same single streaming pass that
+survey_ingest.tally_responses already makes over the response file:
+
+    crosstabs = CrossTabulator(survey_data, [(1, 11), (5, 12)])
+    load_survey_responses('responses.csv', survey_data, crosstabs=crosstabs)
+    for crosstab in crosstabs.results(): ...
+
+Multi-select questions (e.g. Q7) count every selected option once per
+respondent. Only respondents who answered both questions are counted.
+chapter_5.py renders the results as tables and grouped or stacked bar charts.
+"""
+import numpy as np
+
+
+def parse_pair(text):
+    """Parses a 'ROWxCOL' string such as '1x11' into (1, 11)."""
+    try:
+        row_q, col_q = (int(part) for part in text.lower().replace('q', '').split('x'))
+    except ValueError:
+        raise ValueError(f"Invalid cross-tab '{text}' (expected ROWxCOL, e.g. 1x11)")
+    return row_q, col_q
+
+
+class CrossTab:
+    """Contingency table for one pair of questions.
+
+    Row and column vocabularies are seeded from the questions' data dicts, so
+    options keep the report's order; options only seen in the responses are
+    appended as they appear.
+    """
+
+    def __init__(self, row_item, col_item):
+        self.row_q = row_item['question_num']
+        self.col_q = col_item['question_num']
+        self.row_text = row_item['question_text']
+        self.col_text = col_item['question_text']
+        self.row_vocab = {label: code for code, label in enumerate(row_item['data'])}
+        self.col_vocab = {label: code for code, label in enumerate(col_item['data'])}
+        self.counts = np.zeros((len(self.row_vocab), len(self.col_vocab)), dtype=np.int64)
+        self.row_base = np.zeros(len(self.row_vocab), dtype=np.int64) # Respondents per row option
+        self.col_base = np.zeros(len(self.col_vocab), dtype=np.int64) # Respondents per column option
+        self.total = 0 # Respondents who answered both questions
+
+    @property
+    def key(self):
+        return f"{self.row_q}x{self.col_q}"
+
+    @staticmethod
+    def _encode(vocab, label):
+        code = vocab.get(label)
+        if code is None:
+            code = vocab[label] = len(vocab)
+        return code
+
+    def add_chunk(self, row_answers, col_answers):
+        """Adds one chunk of respondents. Both arguments hold one list of
+           selected labels per respondent, aligned by respondent.
+        """
+        pair_rows, pair_cols, base_rows, base_cols = [], [], [], []
+        answered = 0
+        for row_selected, col_selected in zip(row_answers, col_answers):
+            if not row_selected or not col_selected:
+                continue
+            answered += 1
+            rows = {self._encode(self.row_vocab, label) for label in row_selected}
+            cols = {self._encode(self.col_vocab, label) for label in col_selected}
+            base_rows.extend(rows)
+            base_cols.extend(cols)
+            for row in rows:
+                pair_rows.extend([row] * len(cols))
+                pair_cols.extend(cols)
+        if not answered:
+            return
+
+        n_rows, n_cols = len(self.row_vocab), len(self.col_vocab)
+        if self.counts.shape != (n_rows, n_cols):
+            self.counts = np.pad(self.counts, ((0, n_rows - self.counts.shape[0]), (0, n_cols - self.counts.shape[1])))
+            self.row_base = np.pad(self.row_base, (0, n_rows - len(self.row_base)))
+            self.col_base = np.pad(self.col_base, (0, n_cols - len(self.col_base)))
+        # Flattened (row, col) cell index -> one bincount per chunk
+        cells = np.asarray(pair_rows, dtype=np.intp) * n_cols + np.asarray(pair_cols, dtype=np.intp)
+        self.counts += np.bincount(cells, minlength=n_rows * n_cols).reshape(n_rows, n_cols)
+        self.row_base += np.bincount(np.asarray(base_rows, dtype=np.intp), minlength=n_rows)
+        self.col_base += np.bincount(np.asarray(base_cols, dtype=np.intp), minlength=n_cols)
+        self.total += answered
+
+    def summary(self, chart_type='stacked_bar'):
+        """Returns the cross-tab as a plain dict for tables and charts.
+
+        'labels' are the row options, 'series' the column options, 'counts' the
+        count matrix and 'percentages' row percentages (share of each row group
+        giving each column answer). 'row_totals' and 'column_totals' count
+        respondents, so with a multi-select question they can add up to more
+        than 'total_count'. Rows nobody answered are dropped.
+        """
+        row_labels = sorted(self.row_vocab, key=self.row_vocab.get)
+        col_labels = sorted(self.col_vocab, key=self.col_vocab.get)
+        keep = self.row_base > 0
+        counts = self.counts[keep]
+        row_base = self.row_base[keep]
+        percentages = counts / row_base[:, None] * 100 if len(counts) else counts.astype(np.float64)
+        return {
+            'key': self.key,
+            'labels': [label for label, kept in zip(row_labels, keep) if kept],
+            'series': col_labels,
+            'counts': counts.tolist(),
+            'percentages': percentages.tolist(),
+            'row_totals': row_base.tolist(),
+            'column_totals': self.col_base.tolist(),
+            'total_count': self.total,
+            'total_respondents': self.total,
+            'chart_type': chart_type,
+            'row_text': self.row_text,
+            'col_text': self.col_text,
+        }
+
+
+class CrossTabulator:
+    """Fills several CrossTabs from the per-question answer chunks that
+       survey_ingest.tally_responses buffers while streaming responses.
+    """
+
+    def __init__(self, questions, pairs):
+        by_num = {item['question_num']: item for item in questions}
+        self.crosstabs = []
+        for row_q, col_q in pairs:
+            for q_num in (row_q, col_q):
+                if not by_num.get(q_num, {}).get('data'):
+                    raise ValueError(f"Q{q_num} has no answer options and cannot be cross-tabulated")
+            if row_q == col_q:
+                raise ValueError(f"Cannot cross-tabulate Q{row_q} with itself")
+            self.crosstabs.append(CrossTab(by_num[row_q], by_num[col_q]))
+
+    def add_chunk(self, chunk):
+        """chunk maps question_num to that question's answer lists for the
+           same respondents, in the same order.
+        """
+        for crosstab in self.crosstabs:
+            crosstab.add_chunk(chunk[crosstab.row_q], chunk[crosstab.col_q])
+
+    def results(self):
+        return list(self.crosstabs)
@@ -0,0 +1,210 @@
+"""Streaming ingestion of raw survey responses for chapter_5.py.
+
+Reads one respondent per CSV row or JSONL line and tallies the answers per
+question and option in a single pass. Only the counters are kept in memory, so
+files with hundreds of thousands of rows are fine.
+
+Answers are matched to questions by column name: either ``q<number>`` (e.g.
+``q7``) or the exact question_text. Multi-select questions (``"multi_select":
+True`` in survey_data, e.g. Q7) take several options separated by ``;`` in CSV,
+or a JSON list (or ``;``-separated string) in JSONL. Empty answers are skipped.
+Files ending in ``.gz`` are decompressed on the fly. Counting itself is done in
+chunks by survey_aggregate.ColumnarTally.
+
+tally_segments() does the same for several sub-populations at once: every
+distinct value of a segment column (district, branch, agent...) gets its own
+counters, all filled in the one pass over the file.
+"""
+import csv
+import gzip
+import json
+import re
+
+MULTI_SELECT_SEPARATOR = ';'
+CHUNK_SIZE = 10000 # Respondents buffered per NumPy counting pass
+
+
+def _open_text(path):
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8', newline='')
+    return open(path, 'r', encoding='utf-8', newline='')
+
+def _question_columns(columns, questions):
+    """Maps raw column names to the question numbers they answer."""
+    by_text = {item['question_text'].strip().lower(): item['question_num'] for item in questions}
+    known = {item['question_num'] for item in questions}
+    mapping = {}
+    for column in columns:
+        name = str(column).strip().lower()
+        match = re.fullmatch(r'q(\d+)', name)
+        if match and int(match.group(1)) in known:
+            mapping[column] = int(match.group(1))
+        elif name in by_text:
+            mapping[column] = by_text[name]
+    return mapping
+
+def iter_responses(path, fmt=None):
+    """Yields one dict per respondent from a CSV or JSONL file, streaming."""
+    fmt = fmt or ('jsonl' if re.search(r'\.(jsonl|ndjson)(\.gz)?$', path) else 'csv')
+    with _open_text(path) as f:
+        if fmt == 'csv':
+            yield from csv.DictReader(f)
+        elif fmt == 'jsonl':
+            for line_no, line in enumerate(f, 1):
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except ValueError as e:
+                        print(f"Warning: Skipping malformed JSON on line {line_no} of {path}: {e}")
+        else:
+            raise ValueError(f"Unknown response format '{fmt}' (expected 'csv' or 'jsonl')")
+
+def split_answer(value, multi_select):
+    """Normalises one raw answer into a list of selected option labels."""
+    if value is None:
+        return []
+    if isinstance(value, list):
+        values = value
+    elif multi_select:
+        values = str(value).split(MULTI_SELECT_SEPARATOR)
+    else:
+        values = [value]
+    return [str(v).strip() for v in values if str(v).strip()]
+
+class _ResponseTally:
+    """Chunk buffers and counters for one group of respondents."""
+
+    def __init__(self, tallied, crosstabs=None):
+        from survey_aggregate import ColumnarTally
+
+        self.tally = ColumnarTally(tallied)
+        self.chunk = {item['question_num']: [] for item in tallied}
+        self.crosstabs = crosstabs
+        self.respondents = 0
+
+    def add(self, answered):
+        self.respondents += 1
+        for q_num, answers in answered.items():
+            self.chunk[q_num].append(answers or [])
+
+    def flush(self):
+        if self.crosstabs is not None and any(self.chunk.values()):
+            self.crosstabs.add_chunk(self.chunk)
+        for q_num, answers in self.chunk.items():
+            if answers:
+                self.tally.add_chunk(q_num, answers)
+                answers.clear()
+
+def _iter_answers(responses, tallied, multi_select, extra_column=None):
+    """Yields (answered, extra) per respondent, where answered maps every
+       tallied question_num to its selected labels and extra is the raw value
+       of extra_column (matched case-insensitively), if one is given.
+    """
+    columns, column_keys, extra_key = {}, None, None
+    wanted = extra_column.strip().lower() if extra_column else None
+    for response in responses:
+        if response.keys() != column_keys: # CSV headers never change; JSONL keys may
+            column_keys = response.keys()
+            columns = _question_columns(column_keys, tallied)
+            extra_key = next((key for key in column_keys if str(key).strip().lower() == wanted), None)
+        answered = {item['question_num']: None for item in tallied}
+        for column, q_num in columns.items():
+            answered[q_num] = split_answer(response.get(column), q_num in multi_select)
+        yield answered, response.get(extra_key) if extra_key is not None else None
+
+def tally_responses(responses, questions, chunk_size=CHUNK_SIZE, crosstabs=None):
+    """Counts answers per question and option in one pass over responses.
+
+    responses is any iterable of respondent dicts (see iter_responses) and
+    questions the survey_data list; only questions with a 'data' dict are
+    tallied. Answers are buffered chunk_size respondents at a time and counted
+    by survey_aggregate.ColumnarTally. Returns (tallies, total_respondents),
+    where tallies maps question_num to {'counts': {option: n}, 'answered': n}.
+    crosstabs, an optional survey_crosstab.CrossTabulator, is fed the same
+    chunks, so cross-tabs cost no extra pass over the file.
+    """
+    tallied = [item for item in questions if item.get('data')]
+    group = _ResponseTally(tallied, crosstabs)
+    for answered, _ in _iter_answers(responses, tallied, group.tally.multi_select):
+        group.add(answered)
+        if group.respondents % chunk_size == 0:
+            group.flush()
+    group.flush()
+    return group.tally.result(), group.respondents
+
+def tally_segments(responses, questions, segment_column, chunk_size=CHUNK_SIZE, crosstab_factory=None):
+    """Like tally_responses, but counts every segment of respondents (every
+       distinct value of segment_column, e.g. 'district') separately, still in
+       one pass. Returns {segment: (tallies, respondents, crosstabs)} in segment
+       order. crosstab_factory, if given, is called once per segment for that
+       segment's CrossTabulator (None otherwise). Respondents with no segment
+       value are left out. All segments are flushed whenever chunk_size
+       respondents are buffered, so memory stays bounded however many there are.
+    """
+    tallied = [item for item in questions if item.get('data')]
+    multi_select = {item['question_num'] for item in tallied if item.get('multi_select')}
+    groups = {}
+    buffered = skipped = 0
+    for answered, segment in _iter_answers(responses, tallied, multi_select, segment_column):
+        segment = str(segment).strip() if segment is not None else ''
+        if not segment:
+            skipped += 1
+            continue
+        group = groups.get(segment)
+        if group is None:
+            group = groups[segment] = _ResponseTally(tallied, crosstab_factory() if crosstab_factory else None)
+        group.add(answered)
+        buffered += 1
+        if buffered == chunk_size:
+            for group in groups.values():
+                group.flush()
+            buffered = 0
+    if skipped:
+        print(f"Warning: Skipped {skipped} responses with no '{segment_column}' value")
+    if not groups:
+        raise ValueError(f"No responses have a '{segment_column}' value to segment by")
+    for group in groups.values():
+        group.flush()
+    return {segment: (groups[segment].tally.result(), groups[segment].respondents, groups[segment].crosstabs)
+            for segment in sorted(groups)}
+
+def apply_tallies(questions, tallies):
+    """Returns a copy of questions with each data dict replaced by real counts.
+
+    Options keep the order of the hand-written data dict (so colours and table
+    rows stay stable); options only seen in the responses are appended. Each
+    tallied question also gets a 'total_respondents' key with the number of
+    respondents who answered it, used as the percentage base for bar charts.
+    """
+    merged = []
+    for item in questions:
+        tally = tallies.get(item['question_num'])
+        if tally is None:
+            merged.append(item)
+            continue
+        counts = tally['counts']
+        data = {option: counts.get(option, 0) for option in item['data']}
+        data.update((option, n) for option, n in counts.items() if option not in data)
+        merged.append(dict(item, data=data, total_respondents=tally['answered']))
+    return merged
+
+def load_survey_responses(path, questions, fmt=None, crosstabs=None):
+    """Streams a raw response file and returns (survey_data, total_respondents)
+       ready for chapter_5.build_survey_report. crosstabs (a
+       survey_crosstab.CrossTabulator) is filled in the same pass.
+    """
+    tallies, total_respondents = tally_responses(iter_responses(path, fmt), questions, crosstabs=crosstabs)
+    print(f"Tallied {total_respondents} responses from {path}")
+    return apply_tallies(questions, tallies), total_respondents
+
+def load_segmented_responses(path, questions, segment_column, fmt=None, crosstab_factory=None):
+    """Streams a raw response file once and returns {segment: (survey_data,
+       total_respondents, crosstabs)} for chapter_5.build_segmented_reports,
+       one entry per value of segment_column (see tally_segments).
+    """
+    segments = tally_segments(iter_responses(path, fmt), questions, segment_column,
+                              crosstab_factory=crosstab_factory)
+    total_respondents = sum(respondents for _, respondents, _ in segments.values())
+    print(f"Tallied {total_respondents} responses from {path} into {len(segments)} '{segment_column}' segments")
+    return {segment: (apply_tallies(questions, tallies), respondents, crosstabs)
+            for segment, (tallies, respondents, crosstabs) in segments.items()}
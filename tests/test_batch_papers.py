@@ -0,0 +1,36 @@
+import json
+import os
+
+import pytest
+
+import Sample1
+
+
+def _write_paper(path, file_name):
+    with open(Sample1.PAPER_PATH, encoding='utf-8') as f:
+        header, first_question = (json.loads(line) for line, _ in zip(f, range(2)))
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(dict(header, file_name=file_name)) + "\n")
+        f.write(json.dumps(first_question) + "\n")
+
+
+def test_papers_with_the_same_pdf_name_are_rejected(tmp_path):
+    papers, output = tmp_path / 'papers', tmp_path / 'out'
+    papers.mkdir()
+    _write_paper(papers / 'june_2023.jsonl', 'MMPC_018_Solutions.pdf')
+    _write_paper(papers / 'june_2024.jsonl', 'mmpc_018_solutions.pdf')
+
+    with pytest.raises(ValueError, match=r'june_2023\.jsonl, june_2024\.jsonl'):
+        Sample1.build_papers(str(papers), str(output), workers=1)
+    assert not output.exists() or not os.listdir(output)
+
+
+def test_papers_with_distinct_pdf_names_are_all_built(tmp_path):
+    papers, output = tmp_path / 'papers', tmp_path / 'out'
+    papers.mkdir()
+    _write_paper(papers / 'june_2023.jsonl', 'June_2023.pdf')
+    _write_paper(papers / 'june_2024.jsonl', 'June_2024.pdf')
+
+    entries = Sample1.build_papers(str(papers), str(output), workers=1)
+    assert [entry['error'] for entry in entries] == [None, None]
+    assert sorted(os.listdir(output)) == ['June_2023.pdf', 'June_2024.pdf', Sample1.BATCH_SUMMARY_FILE]
@@ -0,0 +1,76 @@
+import copy
+import io
+import json
+import os
+import signal
+import time
+
+from pypdf import PdfReader
+
+import chapter_5
+from report_server import ReportServer
+
+
+def _dataset(shift):
+    """Two single-choice questions whose counts differ with shift."""
+    questions = copy.deepcopy([item for item in chapter_5.survey_data if item.get('chart_type') == 'pie'][:2])
+    for item in questions:
+        item['data'] = {label: 5 + (index * 7 + shift) % 23 for index, label in enumerate(item['data'])}
+    return questions
+
+
+def _chart_pixels(path):
+    return [image.image.tobytes() for page in PdfReader(path).pages for image in page.images]
+
+
+def test_concurrent_survey_jobs_keep_their_own_charts(tmp_path):
+    datasets = {'a': _dataset(0), 'b': _dataset(11)}
+    # Shared on-disk chart settings, as a server started with the defaults would use
+    options = {'chart_dir': str(tmp_path / 'charts'), 'use_chart_cache': False, 'in_memory_charts': False}
+    expected = {}
+    for name, questions in datasets.items():
+        reference = str(tmp_path / f"reference_{name}.pdf")
+        chapter_5.build_survey_report(questions, reference, dict(options, chart_workers=1, in_memory_charts=True))
+        expected[name] = _chart_pixels(reference)
+    assert expected['a'] != expected['b']
+
+    jobs = "".join(json.dumps({'id': f"{name}{index}", 'generator': 'survey',
+                               'output': str(tmp_path / f"{name}{index}.pdf"),
+                               'survey_data': datasets[name], 'options': options}) + "\n"
+                   for index in range(2) for name in datasets)
+    out = io.StringIO()
+    server = ReportServer(concurrency=2)
+    try:
+        server.serve_stream(io.StringIO(jobs), out)
+    finally:
+        server.shutdown()
+    responses = [json.loads(line) for line in out.getvalue().splitlines()]
+
+    assert len(responses) == 4 and all(response['status'] == 'ok' for response in responses), responses
+    for index in range(2):
+        for name in datasets:
+            assert _chart_pixels(tmp_path / f"{name}{index}.pdf") == expected[name]
+
+
+def test_server_replaces_a_pool_broken_by_a_dead_worker(tmp_path):
+    server = ReportServer(concurrency=1)
+    try:
+        out = io.StringIO()
+        job = {'generator': 'exam', 'output': str(tmp_path / 'before.pdf'), 'id': 'before'}
+        server.serve_stream(io.StringIO(json.dumps(job) + "\n"), out)
+        broken = server.executor
+        for process in list(broken._processes.values()): # e.g. killed for running out of memory
+            os.kill(process.pid, signal.SIGKILL)
+        deadline = time.monotonic() + 30
+        while not broken._broken and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert broken._broken
+
+        jobs = "".join(json.dumps({'generator': 'exam', 'output': str(tmp_path / f"after{index}.pdf"),
+                                   'id': f"after{index}"}) + "\n" for index in range(2))
+        server.serve_stream(io.StringIO(jobs), out)
+    finally:
+        server.shutdown()
+    responses = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [response['status'] for response in responses] == ['ok', 'ok', 'ok'], responses
+    assert server.executor is not broken